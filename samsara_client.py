@@ -2,6 +2,7 @@
 Samsara API client for interacting with Samsara's fleet management platform.
 """
 
+import importlib.util
 import os
 from typing import Optional, Dict, Any, List
 import httpx
@@ -21,22 +22,57 @@ class SamsaraRateLimitError(SamsaraError):
 
 class SamsaraAPIError(SamsaraError):
     """Exception raised for API errors from Samsara."""
-    def __init__(self, message: str, status_code: int, response_body: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        response_body: Optional[Dict[str, Any]] = None,
+        response_text: Optional[str] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response_body = response_body
+        # Raw response body as received, so callers can show it without re-serializing
+        self.response_text = response_text
+
+
+# Connection pool for the long-lived client: keep idle connections to the API
+# host open between tool calls so they skip the TCP/TLS handshake
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=75.0,
+)
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+# (`httpx[http2]`); use it when present so concurrent tool calls share one
+# multiplexed connection. Response compression needs no setup: httpx sends
+# Accept-Encoding for every codec it can decode (gzip, deflate, plus br/zstd
+# when brotli/zstandard are installed) and decompresses transparently.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class SamsaraClient:
     """Client for interacting with the Samsara API."""
     
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        base_url: str = "https://api.samsara.com",
+        timeout: float = 30.0,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = HTTP2_AVAILABLE,
+    ):
         """
         Initialize the Samsara client.
         
         Args:
             api_token: Samsara API token. If not provided, will try to get from
                      SAMSARA_API_TOKEN environment variable.
+            base_url: Samsara API base URL
+            timeout: Request timeout in seconds
+            limits: Connection pool limits for the underlying httpx.AsyncClient
+            http2: Negotiate HTTP/2 (requires the h2 package)
         """
         self.api_token = api_token or os.getenv("SAMSARA_API_TOKEN")
         if not self.api_token:
@@ -45,14 +81,16 @@ class SamsaraClient:
                 "variable or pass api_token parameter."
             )
         
-        self.base_url = "https://api.samsara.com"
+        self.base_url = base_url
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers={
                 "Authorization": f"Bearer {self.api_token}",
                 "Content-Type": "application/json",
             },
-            timeout=30.0,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
         )
     
     async def list_vehicles(
@@ -161,6 +199,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
             
             return response.json()
@@ -233,6 +272,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -303,6 +343,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -421,6 +462,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -549,6 +591,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -637,6 +680,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -744,6 +788,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -852,6 +897,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -930,6 +976,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -999,6 +1046,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1069,6 +1117,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1139,6 +1188,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1217,6 +1267,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1288,6 +1339,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1393,6 +1445,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1461,6 +1514,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -1527,6 +1581,7 @@ class SamsaraClient:
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
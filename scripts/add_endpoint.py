@@ -30,8 +30,8 @@ Input JSON format (OpenAPI-style, supports multiple operations per endpoint):
 
 Outputs five sections to stdout for each operation:
   1. samsara_client.py — async method
-  2. server.py list_tools() — Tool registration
-  3. server.py call_tool() — elif handler block
+  2. server.py _TOOLS — Tool registration
+  3. server.py _handle_<tool>() — handler registered in TOOL_HANDLERS
   4. tests/test_samsara_client.py — test stubs
   5. README.md — Features and Available Tools snippets
 """
@@ -40,7 +40,6 @@ import argparse
 import json
 import re
 import sys
-from typing import Any
 
 
 def camel_to_snake(name: str) -> str:
@@ -272,6 +271,7 @@ def gen_client_method(path: str, method: str, method_name: str, parameters: list
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -371,6 +371,7 @@ def gen_client_method(path: str, method: str, method_name: str, parameters: list
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -442,6 +443,7 @@ def gen_client_method(path: str, method: str, method_name: str, parameters: list
                     error_message,
                     status_code=response.status_code,
                     response_body=error_body,
+                    response_text=response.text,
                 )
 
             return response.json()
@@ -459,7 +461,7 @@ def gen_client_method(path: str, method: str, method_name: str, parameters: list
 
 
 def gen_tool_registration(method_name: str, path: str, method: str, parameters: list[dict], summary: str, description: str) -> str:
-    """Generate Tool(...) for server.py list_tools."""
+    """Generate the _<TOOL>_SCHEMA constant and Tool(...) entry for server.py _TOOLS."""
     summary_clean = (summary or description or "").replace("\n", " ").strip()[:200]
     desc_repr = repr(summary_clean) if summary_clean else repr("(Add description.)")
     path_params = [p for p in parameters if p.get("in") == "path"]
@@ -472,7 +474,8 @@ def gen_tool_registration(method_name: str, path: str, method: str, parameters:
             name_camel = p["name"]
             typ = p["type"]
             desc_param = (p.get("description") or "").replace("\n", " ").strip()[:120].replace('"', '\\"')
-            if p.get("in") == "path" or p.get("required"):
+            is_required = p.get("in") == "path" or p.get("required")
+            if is_required:
                 required_params.append(name_camel)
             if typ == "integer":
                 props.append(f'''                    "{name_camel}": {{
@@ -485,8 +488,9 @@ def gen_tool_registration(method_name: str, path: str, method: str, parameters:
                         "description": "{desc_param}",
                     }},''')
             elif typ == "array":
+                min_items = '\n                        "minItems": 1,' if is_required else ""
                 props.append(f'''                    "{name_camel}": {{
-                        "type": "array",
+                        "type": "array",{min_items}
                         "items": {{"type": "string"}},
                         "description": "{desc_param}",
                     }},''')
@@ -498,8 +502,10 @@ def gen_tool_registration(method_name: str, path: str, method: str, parameters:
                         "description": "{desc_param}",
                     }},''')
             else:
+                # Required strings must be non-empty, not just present
+                min_length = '\n                        "minLength": 1,' if is_required else ""
                 props.append(f'''                    "{name_camel}": {{
-                        "type": "string",
+                        "type": "string",{min_length}
                         "description": "{desc_param}",
                     }},''')
         props_str = "\n".join(props)
@@ -524,6 +530,7 @@ def gen_tool_registration(method_name: str, path: str, method: str, parameters:
             desc_param = (p.get("description") or "").replace("\n", " ").strip()[:120].replace('"', '\\"')
             props.append(f'''                    "{name_camel}": {{
                         "type": "string",
+                        "minLength": 1,
                         "description": "{desc_param}",
                     }},''')
             required_params.append(name_camel)
@@ -558,80 +565,55 @@ def gen_tool_registration(method_name: str, path: str, method: str, parameters:
                 "properties": {},
             },'''
 
-    return f'''        Tool(
-            name="{method_name}",
-            description=(
-                {desc_repr}
-            ),
-{schema_block}
-        ),'''
+    # Schemas live in module-level _<TOOL>_SCHEMA constants referenced from _TOOLS
+    schema_const = f"_{method_name.upper()}_SCHEMA"
+    schema_lines = schema_block.strip().removeprefix("inputSchema=").removesuffix(",").split("\n")
+    schema_literal = "\n".join([schema_lines[0]] + [line[12:] for line in schema_lines[1:]])
+
+    return f'''{schema_const}: dict[str, Any] = {schema_literal}
+
+
+    Tool(
+        name="{method_name}",
+        description=(
+            {desc_repr}
+        ),
+        inputSchema={schema_const},
+    ),'''
+
+
+def _handler_function(method_name: str, body: str) -> str:
+    """Wrap a handler body in an async _handle_<tool> function registered with @_tool_handler."""
+    return f'''@_tool_handler("{method_name}")
+async def _handle_{method_name}(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the {method_name} tool."""
+{body}'''
 
 
 def gen_call_tool_handler(method_name: str, method: str, parameters: list[dict]) -> str:
-    """Generate elif block for server.py call_tool."""
+    """Generate the _handle_<tool> function for server.py TOOL_HANDLERS."""
     if method == "get":
-        path_params = [p for p in parameters if p.get("in") == "path"]
-        required_query_params = [p for p in parameters if p.get("in") != "path" and p.get("required")]
-        all_required = path_params + required_query_params
         arg_gets = []
         client_args = []
         for p in parameters:
             name_camel = p["name"]
             name_snake = camel_to_snake(name_camel)
-            arg_gets.append(f"            {name_snake} = arguments.get(\"{name_camel}\")")
-            client_args.append(f"                {name_snake}={name_snake},")
+            arg_gets.append(f"    {name_snake} = arguments.get(\"{name_camel}\")")
+            client_args.append(f"        {name_snake}={name_snake},")
         arg_gets_str = "\n".join(arg_gets)
         client_args_str = "\n".join(client_args)
-        # Validate required params
-        validation_block = ""
-        if all_required:
-            required_check = " or ".join(f"not {camel_to_snake(p['name'])}" for p in all_required)
-            param_list = ", ".join(f"'{p['name']}'" for p in all_required)
-            validation_block = f'''
-            if {required_check}:
-                return [TextContent(
-                    type="text",
-                    text="Error: {method_name} requires {param_list}."
-                )]
-'''
         if parameters:
-            call_block = f'''{arg_gets_str}
-{validation_block}
-            result = await client.{method_name}(
-{client_args_str}
-            )
+            body = f'''{arg_gets_str}
 
-            import json'''
+    return await client.{method_name}(
+{client_args_str}
+    )
+'''
         else:
-            call_block = f'''            result = await client.{method_name}()
-
-            import json'''
-        return f'''    elif name == "{method_name}":
-        try:
-{call_block}
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\\n\\nPlease wait {{e.retry_after}} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {{error_message}}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\\n\\nResponse details: {{json.dumps(e.response_body, indent=2)}}"
-            return [TextContent(type="text", text=f"Error: {{error_message}}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {{str(e)}}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {{type(e).__name__}}: {{str(e)}}"
-            )]'''
+            body = f'''    return await client.{method_name}()
+'''
     elif method == "patch":
         # PATCH: extract id (path param) and body
         path_params = [p for p in parameters if p.get("in") == "path"]
@@ -640,78 +622,23 @@ def gen_call_tool_handler(method_name: str, method: str, parameters: list[dict])
         for p in path_params:
             name_camel = p["name"]
             name_snake = camel_to_snake(name_camel)
-            arg_gets.append(f"            {name_snake} = arguments.get(\"{name_camel}\")")
-            client_args.append(f"                {name_snake}={name_snake},")
-        arg_gets.append("            body = arguments.get(\"body\") or {}")
-        client_args.append("                body=body,")
+            arg_gets.append(f"    {name_snake} = arguments.get(\"{name_camel}\")")
+            client_args.append(f"        {name_snake}={name_snake},")
+        arg_gets.append("    body = arguments.get(\"body\") or {}")
+        client_args.append("        body=body,")
         arg_gets_str = "\n".join(arg_gets)
         client_args_str = "\n".join(client_args)
-        # Validate required params
-        required_check = " or ".join([f"not {camel_to_snake(p['name'])}" for p in path_params] + ["not body"])
-        param_list = ", ".join([f"'{p['name']}'" for p in path_params] + ["'body'"])
-        return f'''    elif name == "{method_name}":
-        try:
-{arg_gets_str}
+        body = f'''{arg_gets_str}
 
-            if {required_check}:
-                return [TextContent(
-                    type="text",
-                    text="Error: {method_name} requires {param_list}."
-                )]
-
-            result = await client.{method_name}(
+    return await client.{method_name}(
 {client_args_str}
-            )
-
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\\n\\nPlease wait {{e.retry_after}} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {{error_message}}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\\n\\nResponse details: {{json.dumps(e.response_body, indent=2)}}"
-            return [TextContent(type="text", text=f"Error: {{error_message}}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {{str(e)}}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {{type(e).__name__}}: {{str(e)}}"
-            )]'''
+    )
+'''
     else:
-        return f'''    elif name == "{method_name}":
-        try:
-            body = arguments.get("body") or {{}}
-            result = await client.{method_name}(body)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\\n\\nPlease wait {{e.retry_after}} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {{error_message}}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\\n\\nResponse details: {{json.dumps(e.response_body, indent=2)}}"
-            return [TextContent(type="text", text=f"Error: {{error_message}}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {{str(e)}}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {{type(e).__name__}}: {{str(e)}}"
-            )]'''
+        body = f'''    body = arguments.get("body") or {{}}
+    return await client.{method_name}(body)
+'''
+    return _handler_function(method_name, body)
 
 
 def gen_test_stub(method_name: str, path: str, method: str, parameters: list[dict]) -> str:
@@ -934,12 +861,12 @@ def generate_for_operation(
     print(client_code)
 
     print("=" * 60)
-    print("2. server.py list_tools() — add this Tool(...) to the return list")
+    print("2. server.py — add the schema constant above _TOOLS and the Tool(...) to _TOOLS")
     print("=" * 60)
     print(tool_code)
 
     print("\n" + "=" * 60)
-    print("3. server.py call_tool() — add this elif block (before 'else: raise ValueError')")
+    print("3. server.py — add this handler (the decorator registers it in TOOL_HANDLERS)")
     print("=" * 60)
     print(handler_code)
 
@@ -3,1522 +3,1473 @@ MCP Server for Samsara API integration.
 """
 
 import asyncio
+import functools
+import logging
 import os
 import sys
-from datetime import datetime, timezone, timedelta
-from typing import Any, Sequence
+import time
+from typing import Any, Awaitable, Callable, Sequence
 
+import jsonschema
+import orjson
 from dotenv import load_dotenv
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import CallToolResult, Tool, TextContent
 
 from samsara_client import SamsaraClient, SamsaraError, SamsaraRateLimitError, SamsaraAPIError
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 load_dotenv()
 
-
-# Create a single Samsara client instance at module level
-# This will be initialized once at startup
-_samsara_client: SamsaraClient | None = None
+# Configuration is read from the environment once, at import. A missing token
+# is reported by get_samsara_client(), which main() calls at startup.
+_API_TOKEN = os.environ.get("SAMSARA_API_TOKEN")
+_BASE_URL = os.environ.get("SAMSARA_BASE_URL", "https://api.samsara.com")
+_TIMEOUT = float(os.environ.get("SAMSARA_TIMEOUT", "30"))
+_MAX_CONCURRENT_TOOLS = int(os.environ.get("SAMSARA_MAX_CONCURRENT_TOOLS", "16"))
+_MAX_PENDING_TOOLS = int(os.environ.get("SAMSARA_MAX_PENDING_TOOLS", "64"))
+_PRETTY_JSON = os.environ.get("SAMSARA_PRETTY_JSON", "").lower() in ("1", "true", "yes")
 
 
+# A single Samsara client instance is created on first use (at startup) and
+# cached for the lifetime of the process
+@functools.cache
 def get_samsara_client() -> SamsaraClient:
     """Get or create the Samsara client instance."""
-    global _samsara_client
-    if _samsara_client is None:
-        api_token = os.getenv("SAMSARA_API_TOKEN")
-        if not api_token:
-            raise ValueError(
-                "SAMSARA_API_TOKEN environment variable is required"
-            )
-        _samsara_client = SamsaraClient(api_token=api_token)
-    return _samsara_client
-
-
-# Create MCP server instance
-server = Server("samsara-mcp-server")
-
-
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="list_vehicles",
-            description=(
-                "List all vehicles from the Samsara fleet. "
-                "Supports filtering by tags, attributes, and time ranges. "
-                "Rate limit: 25 requests/sec."
+    if not _API_TOKEN:
+        raise ValueError(
+            "SAMSARA_API_TOKEN environment variable is required"
+        )
+    return SamsaraClient(api_token=_API_TOKEN, base_url=_BASE_URL, timeout=_TIMEOUT)
+
+
+# Shared inputSchema property definitions, reused by every tool that accepts them
+_PROP_AFTER = {
+    "type": "string",
+    "description": (
+        "Pagination cursor (endCursor) from the previous page of results. "
+        "When present, returns the next page."
+    ),
+}
+
+_PROP_LIMIT_512 = {
+    "type": "integer",
+    "description": "Number of results to return (1-512, default 512).",
+    "minimum": 1,
+    "maximum": 512,
+}
+
+_PROP_TAG_IDS = {
+    "type": "string",
+    "description": "Comma-separated list of tag IDs to filter by. Example: '1234,5678'",
+}
+
+_PROP_ATTRIBUTES = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": (
+        "A filter on the data to return entities having given attributes "
+        "using either name-value pair, or range query (only for numeric "
+        "and date attributes) separated by a comma. Only entities meeting "
+        "all the conditions will be returned. Example: "
+        "['ExampleAttributeName:some_value', 'SomeOtherAttr:123', "
+        "'Length:range(10,20)', 'Date:range(2025-01-01,2025-01-31)']"
+    ),
+}
+
+
+def _time_prop(purpose: str) -> dict[str, Any]:
+    """Build a string property described as an RFC 3339 timestamp for the given purpose."""
+    return {
+        "type": "string",
+        "description": f"RFC 3339 timestamp {purpose}. Example: 2019-06-13T19:08:25Z",
+    }
+
+
+_PROP_START_TIME = _time_prop("to begin receiving data")
+_PROP_END_TIME = _time_prop("end range")
+_PROP_UPDATED_AFTER_TIME = _time_prop("to filter on data updated at or after this time")
+_PROP_CREATED_AFTER_TIME = _time_prop("to filter on data created at or after this time")
+
+
+# Closed value sets used as inputSchema enums. Defined once so every schema that
+# accepts them shares the same list (and the same string objects).
+_SAFETY_EVENT_TIME_FIELDS = ["updatedAtTime", "createdAtTime"]
+_TRIP_TIME_FIELDS = ["updatedAtTime", "tripStartTime"]
+_TRIP_COMPLETION_STATUSES = ["inProgress", "completed", "all"]
+_DRIVER_ACTIVATION_STATUSES = ["active", "deactivated"]
+_DRIVER_LOCALES = ["us", "at", "be", "ca", "gb", "fr", "de", "ie", "it", "lu", "mx", "nl", "es", "ch", "pr"]
+
+
+# Tool input schemas, one per tool, referenced from _TOOLS below
+_LIST_VEHICLES_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "limit": _PROP_LIMIT_512,
+        "after": _PROP_AFTER,
+        "parentTagIds": {
+            "type": "string",
+            "description": (
+                "A filter on the data based on this comma-separated list of "
+                "parent tag IDs, for use by orgs with tag hierarchies. "
+                "Specifying a parent tag will implicitly include all descendent "
+                "tags of the parent tag. Example: '345,678'"
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": (
-                            "The limit for how many objects will be in the response. "
-                            "Default and max for this value is 512 objects."
-                        ),
-                        "minimum": 1,
-                        "maximum": 512,
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": (
-                            "If specified, this should be the endCursor value from "
-                            "the previous page of results. When present, this request "
-                            "will return the next page of results that occur immediately "
-                            "after the previous page of results."
-                        ),
-                    },
-                    "parentTagIds": {
-                        "type": "string",
-                        "description": (
-                            "A filter on the data based on this comma-separated list of "
-                            "parent tag IDs, for use by orgs with tag hierarchies. "
-                            "Specifying a parent tag will implicitly include all descendent "
-                            "tags of the parent tag. Example: '345,678'"
-                        ),
-                    },
-                    "tagIds": {
-                        "type": "string",
-                        "description": (
-                            "A filter on the data based on this comma-separated list of "
-                            "tag IDs. Example: '1234,5678'"
-                        ),
-                    },
-                    "attributeValueIds": {
-                        "type": "string",
-                        "description": (
-                            "A filter on the data based on this comma-separated list of "
-                            "attribute value IDs. Only entities associated with ALL of the "
-                            "referenced values will be returned. Example: "
-                            "'076efac2-83b5-47aa-ba36-18428436dcac,6707b3f0-23b9-4fe3-b7be-11be34aea544'"
-                        ),
-                    },
-                    "attributes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "A filter on the data to return entities having given attributes "
-                            "using either name-value pair, or range query (only for numeric "
-                            "and date attributes) separated by a comma. Only entities meeting "
-                            "all the conditions will be returned. Example: "
-                            "['ExampleAttributeName:some_value', 'SomeOtherAttr:123', "
-                            "'Length:range(10,20)', 'Date:range(2025-01-01,2025-01-31)']"
-                        ),
-                    },
-                    "updatedAfterTime": {
-                        "type": "string",
-                        "description": (
-                            "A filter on data to have an updated at time after or equal to "
-                            "this specified time in RFC 3339 format. Millisecond precision "
-                            "and timezones are supported. Examples: 2019-06-13T19:08:25Z, "
-                            "2019-06-13T19:08:25.455Z, OR 2015-09-15T14:00:12-04:00"
-                        ),
-                    },
-                    "createdAfterTime": {
-                        "type": "string",
-                        "description": (
-                            "A filter on data to have a created at time after or equal to "
-                            "this specified time in RFC 3339 format. Millisecond precision "
-                            "and timezones are supported. Examples: 2019-06-13T19:08:25Z, "
-                            "2019-06-13T19:08:25.455Z, OR 2015-09-15T14:00:12-04:00"
-                        ),
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_vehicle",
-            description=(
-                "Retrieve a single vehicle by ID. Use Samsara vehicle ID or external ID "
-                "(e.g. maintenanceId:250020 or samsara.vin:1HGBH41JXMN109186). Requires Read Vehicles scope."
+        },
+        "tagIds": _PROP_TAG_IDS,
+        "attributeValueIds": {
+            "type": "string",
+            "description": (
+                "A filter on the data based on this comma-separated list of "
+                "attribute value IDs. Only entities associated with ALL of the "
+                "referenced values will be returned. Example: "
+                "'076efac2-83b5-47aa-ba36-18428436dcac,6707b3f0-23b9-4fe3-b7be-11be34aea544'"
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "string",
-                        "description": (
-                            "ID of the vehicle. Samsara ID or external ID in key:value format "
-                            "(e.g. maintenanceId:250020, samsara.vin:1HGBH41JXMN109186)."
-                        ),
-                    },
-                },
-                "required": ["id"],
-            },
-        ),
-        Tool(
-            name="update_vehicle",
-            description=(
-                "Update a vehicle by ID. Pass only the fields to update (e.g. name, notes, tagIds). "
-                "No required fields in body. Requires Write Vehicles scope."
+        },
+        "attributes": _PROP_ATTRIBUTES,
+        "updatedAfterTime": _PROP_UPDATED_AFTER_TIME,
+        "createdAfterTime": _PROP_CREATED_AFTER_TIME,
+    },
+}
+
+_GET_VEHICLE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": "string",
+            "minLength": 1,
+            "description": (
+                "ID of the vehicle. Samsara ID or external ID in key:value format "
+                "(e.g. maintenanceId:250020, samsara.vin:1HGBH41JXMN109186)."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "string",
-                        "description": (
-                            "ID of the vehicle. Samsara ID or external ID in key:value format."
-                        ),
-                    },
-                    "body": {
-                        "type": "object",
-                        "description": "Fields to update (UpdateVehicleRequest). Only include fields you wish to patch.",
-                    },
-                },
-                "required": ["id", "body"],
-            },
-        ),
-        Tool(
-            name="get_asset_locations",
-            description=(
-                "Get current location and speed data for assets. "
-                "Returns GPS coordinates, optional street addresses, and speed. "
-                "Use includeReverseGeo=true to get human-readable addresses. "
-                "By default, returns recent data (last 5 minutes) with addresses and speed included."
+        },
+    },
+    "required": ["id"],
+}
+
+_UPDATE_VEHICLE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": "string",
+            "minLength": 1,
+            "description": (
+                "ID of the vehicle. Samsara ID or external ID in key:value format."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "after": {
-                        "type": "string",
-                        "description": "Pagination cursor from previous response.",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return (default 512, max 512).",
-                        "minimum": 1,
-                        "maximum": 512,
-                    },
-                    "startTime": {
-                        "type": "string",
-                        "description": (
-                            "Start time in RFC 3339 format. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "endTime": {
-                        "type": "string",
-                        "description": (
-                            "End time in RFC 3339 format. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "ids": {
-                        "type": "string",
-                        "description": "Comma-separated list of asset IDs to filter by.",
-                    },
-                    "includeSpeed": {
-                        "type": "boolean",
-                        "description": "Include speed data in the response.",
-                    },
-                    "includeReverseGeo": {
-                        "type": "boolean",
-                        "description": "Include street address in the response.",
-                    },
-                    "includeGeofenceLookup": {
-                        "type": "boolean",
-                        "description": "Include geofence information in the response.",
-                    },
-                    "includeHighFrequencyLocations": {
-                        "type": "boolean",
-                        "description": "Include high frequency location data.",
-                    },
-                    "includeExternalIds": {
-                        "type": "boolean",
-                        "description": "Include external IDs in the response.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_safety_events",
-            description=(
-                "Get safety events like harsh braking, speeding, collisions, drowsiness, "
-                "mobile usage, and seatbelt violations. Requires a start time. "
-                "Use behaviorLabels to filter by event type, eventStates to filter by coaching status. "
-                "Set includeDriver=true and includeAsset=true to get full context. "
-                "By default, returns events from the last 7 days with driver and asset details included."
+        },
+        "body": {
+            "type": "object",
+            "description": "Fields to update (UpdateVehicleRequest). Only include fields you wish to patch.",
+        },
+    },
+    "required": ["id", "body"],
+}
+
+_GET_ASSET_LOCATIONS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "after": _PROP_AFTER,
+        "limit": _PROP_LIMIT_512,
+        "startTime": _PROP_START_TIME,
+        "endTime": _PROP_END_TIME,
+        "ids": {
+            "type": "string",
+            "description": "Comma-separated list of asset IDs to filter by.",
+        },
+        "includeSpeed": {
+            "type": "boolean",
+            "description": "Include speed data in the response.",
+        },
+        "includeReverseGeo": {
+            "type": "boolean",
+            "description": "Include street address in the response.",
+        },
+        "includeGeofenceLookup": {
+            "type": "boolean",
+            "description": "Include geofence information in the response.",
+        },
+        "includeHighFrequencyLocations": {
+            "type": "boolean",
+            "description": "Include high frequency location data.",
+        },
+        "includeExternalIds": {
+            "type": "boolean",
+            "description": "Include external IDs in the response.",
+        },
+    },
+}
+
+_GET_SAFETY_EVENTS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "startTime": _PROP_START_TIME,
+        "endTime": _PROP_END_TIME,
+        "queryByTimeField": {
+            "type": "string",
+            "enum": _SAFETY_EVENT_TIME_FIELDS,
+            "description": "Query by 'updatedAtTime' (default) or 'createdAtTime'.",
+        },
+        "assetIds": {
+            "type": "string",
+            "description": "Comma-separated asset IDs to filter by.",
+        },
+        "driverIds": {
+            "type": "string",
+            "description": "Comma-separated driver IDs to filter by.",
+        },
+        "tagIds": _PROP_TAG_IDS,
+        "assignedCoaches": {
+            "type": "string",
+            "description": "Comma-separated coach IDs to filter by.",
+        },
+        "behaviorLabels": {
+            "type": "string",
+            "description": (
+                "Filter by behavior type. Options: Acceleration, Braking, Crash, "
+                "Speeding, HarshTurn, FollowingDistance, LaneDeparture, Drowsy, "
+                "MobileUsage, NoSeatbelt, RanRedLight, RollingStop, etc."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "startTime": {
-                        "type": "string",
-                        "description": (
-                            "RFC 3339 timestamp to begin receiving data. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "endTime": {
-                        "type": "string",
-                        "description": (
-                            "RFC 3339 timestamp end range. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "queryByTimeField": {
-                        "type": "string",
-                        "enum": ["updatedAtTime", "createdAtTime"],
-                        "description": "Query by 'updatedAtTime' (default) or 'createdAtTime'.",
-                    },
-                    "assetIds": {
-                        "type": "string",
-                        "description": "Comma-separated asset IDs to filter by.",
-                    },
-                    "driverIds": {
-                        "type": "string",
-                        "description": "Comma-separated driver IDs to filter by.",
-                    },
-                    "tagIds": {
-                        "type": "string",
-                        "description": "Comma-separated tag IDs to filter by.",
-                    },
-                    "assignedCoaches": {
-                        "type": "string",
-                        "description": "Comma-separated coach IDs to filter by.",
-                    },
-                    "behaviorLabels": {
-                        "type": "string",
-                        "description": (
-                            "Filter by behavior type. Options: Acceleration, Braking, Crash, "
-                            "Speeding, HarshTurn, FollowingDistance, LaneDeparture, Drowsy, "
-                            "MobileUsage, NoSeatbelt, RanRedLight, RollingStop, etc."
-                        ),
-                    },
-                    "eventStates": {
-                        "type": "string",
-                        "description": (
-                            "Filter by state. Options: needsReview, reviewed, needsCoaching, "
-                            "coached, dismissed, needsRecognition, recognized."
-                        ),
-                    },
-                    "includeAsset": {
-                        "type": "boolean",
-                        "description": "Include asset details in response.",
-                    },
-                    "includeDriver": {
-                        "type": "boolean",
-                        "description": "Include driver details in response.",
-                    },
-                    "includeVgOnlyEvents": {
-                        "type": "boolean",
-                        "description": "Include video-only events.",
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": "Pagination cursor from previous response.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_safety_events_by_id",
-            description=(
-                "Get details for specified safety events by ID. Requires a list of safety event IDs (UUIDs). "
-                "Use get_safety_events (stream) first to discover event IDs. "
-                "Optional: includeAsset, includeDriver, includeVgOnlyEvents for expanded data; after for pagination. "
-                "Rate limit: 5 requests/sec. Scope: Read Safety Events & Scores (Safety & Cameras)."
+        },
+        "eventStates": {
+            "type": "string",
+            "description": (
+                "Filter by state. Options: needsReview, reviewed, needsCoaching, "
+                "coached, dismissed, needsRecognition, recognized."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "safetyEventIds": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "Required. Comma-separated or array of safety event IDs (Samsara UUIDs). "
-                            "Use get_safety_events to get event IDs first."
-                        ),
-                    },
-                    "includeAsset": {
-                        "type": "boolean",
-                        "description": "Include expanded asset data in response.",
-                    },
-                    "includeDriver": {
-                        "type": "boolean",
-                        "description": "Include expanded driver data in response.",
-                    },
-                    "includeVgOnlyEvents": {
-                        "type": "boolean",
-                        "description": "Include events from devices with only a Vehicle Gateway (VG).",
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": "Pagination cursor from previous response.",
-                    },
-                },
-                "required": ["safetyEventIds"],
-            },
-        ),
-        Tool(
-            name="get_trips",
-            description=(
-                "Get trip history for specific vehicles. Returns trip start/end times, "
-                "locations, distance, and duration. Requires asset IDs - use list_vehicles "
-                "first to get IDs if needed. Use completionStatus='inProgress' to see active "
-                "trips, 'completed' for finished trips. "
-                "By default, returns trips from the last 7 days with asset details included."
+        },
+        "includeAsset": {
+            "type": "boolean",
+            "description": "Include asset details in response.",
+        },
+        "includeDriver": {
+            "type": "boolean",
+            "description": "Include driver details in response.",
+        },
+        "includeVgOnlyEvents": {
+            "type": "boolean",
+            "description": "Include video-only events.",
+        },
+        "after": _PROP_AFTER,
+    },
+}
+
+_GET_SAFETY_EVENTS_BY_ID_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "safetyEventIds": {
+            "type": ["array", "string"],
+            "minItems": 1,
+            "items": {"type": "string"},
+            # A comma-separated string must name at least one ID
+            "pattern": "[^,\\s]",
+            "description": (
+                "Required. Comma-separated or array of safety event IDs (Samsara UUIDs). "
+                "Use get_safety_events to get event IDs first."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ids": {
-                        "type": "string",
-                        "description": (
-                            "Comma-separated list of asset IDs (up to 50). Required. "
-                            "Use list_vehicles to find asset IDs if you only have vehicle names."
-                        ),
-                    },
-                    "startTime": {
-                        "type": "string",
-                        "description": (
-                            "RFC 3339 timestamp to begin receiving data. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "endTime": {
-                        "type": "string",
-                        "description": (
-                            "RFC 3339 timestamp end range. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "queryBy": {
-                        "type": "string",
-                        "enum": ["updatedAtTime", "tripStartTime"],
-                        "description": "Query by 'updatedAtTime' (default) or 'tripStartTime'.",
-                    },
-                    "completionStatus": {
-                        "type": "string",
-                        "enum": ["inProgress", "completed", "all"],
-                        "description": (
-                            "Filter by trip status: 'inProgress' for active trips, "
-                            "'completed' for finished trips, 'all' for both (default)."
-                        ),
-                    },
-                    "includeAsset": {
-                        "type": "boolean",
-                        "description": "Include asset details in response.",
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": "Pagination cursor from previous response.",
-                    },
-                },
-                "required": ["ids"],
-            },
-        ),
-        Tool(
-            name="get_drivers",
-            description=(
-                "List all drivers in the organization. "
-                "Use driverActivationStatus='active' (default) or 'deactivated'. "
-                "Supports filtering by tags, attributes, and time ranges. "
-                "Use 'after' with endCursor from previous response for pagination. "
-                "Requires Read Drivers scope."
+        },
+        "includeAsset": {
+            "type": "boolean",
+            "description": "Include expanded asset data in response.",
+        },
+        "includeDriver": {
+            "type": "boolean",
+            "description": "Include expanded driver data in response.",
+        },
+        "includeVgOnlyEvents": {
+            "type": "boolean",
+            "description": "Include events from devices with only a Vehicle Gateway (VG).",
+        },
+        "after": _PROP_AFTER,
+    },
+    "required": ["safetyEventIds"],
+}
+
+_GET_TRIPS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "ids": {
+            "type": "string",
+            "minLength": 1,
+            "description": (
+                "Comma-separated list of asset IDs (up to 50). Required. "
+                "Use list_vehicles to find asset IDs if you only have vehicle names."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "driverActivationStatus": {
-                        "type": "string",
-                        "enum": ["active", "deactivated"],
-                        "description": (
-                            "If 'deactivated', only deactivated drivers are returned. "
-                            "Defaults to 'active' if not provided."
-                        ),
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "The limit for how many objects will be in the response. Default and max is 512.",
-                        "minimum": 1,
-                        "maximum": 512,
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": (
-                            "Pagination cursor (endCursor) from the previous page of results. "
-                            "When present, returns the next page."
-                        ),
-                    },
-                    "parentTagIds": {
-                        "type": "string",
-                        "description": "Comma-separated list of parent tag IDs. Example: '345,678'",
-                    },
-                    "tagIds": {
-                        "type": "string",
-                        "description": "Comma-separated list of tag IDs. Example: '1234,5678'",
-                    },
-                    "attributeValueIds": {
-                        "type": "string",
-                        "description": "Comma-separated list of attribute value IDs.",
-                    },
-                    "attributes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "Filter by attributes (name-value or range). "
-                            "Example: ['ExampleAttribute:value', 'NumericAttr:range(10,20)']"
-                        ),
-                    },
-                    "updatedAfterTime": {
-                        "type": "string",
-                        "description": (
-                            "Filter by updated at time in RFC 3339 format. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                    "createdAfterTime": {
-                        "type": "string",
-                        "description": (
-                            "Filter by created at time in RFC 3339 format. "
-                            "Example: 2019-06-13T19:08:25Z"
-                        ),
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="create_driver",
-            description=(
-                "Create a new driver in the organization. "
-                "Requires name, password, and username. Username must be unique and cannot contain spaces or '@'. "
-                "Optional: licenseNumber, licenseState, phone, notes, tagIds, timezone, externalIds, etc. "
-                "Requires Write Drivers scope."
+        },
+        "startTime": _PROP_START_TIME,
+        "endTime": _PROP_END_TIME,
+        "queryBy": {
+            "type": "string",
+            "enum": _TRIP_TIME_FIELDS,
+            "description": "Query by 'updatedAtTime' (default) or 'tripStartTime'.",
+        },
+        "completionStatus": {
+            "type": "string",
+            "enum": _TRIP_COMPLETION_STATUSES,
+            "description": (
+                "Filter by trip status: 'inProgress' for active trips, "
+                "'completed' for finished trips, 'all' for both (default)."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Driver's full name (1-255 characters).",
-                        "minLength": 1,
-                        "maxLength": 255,
-                    },
-                    "username": {
-                        "type": "string",
-                        "description": (
-                            "Driver's login username for the driver app. Must be unique, "
-                            "no spaces or '@' (1-189 characters)."
-                        ),
-                        "minLength": 1,
-                        "maxLength": 189,
-                    },
-                    "password": {
-                        "type": "string",
-                        "description": "Password for the driver to log into the Samsara driver app.",
-                    },
-                    "licenseNumber": {
-                        "type": "string",
-                        "description": "Driver's state-issued license number. With licenseState must be unique.",
-                    },
-                    "licenseState": {
-                        "type": "string",
-                        "description": "US state, Canadian province, or US territory abbreviation (e.g. CA).",
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "Driver's phone number (max 255 characters).",
-                        "maxLength": 255,
-                    },
-                    "notes": {
-                        "type": "string",
-                        "description": "Notes about the driver (max 4096 characters).",
-                        "maxLength": 4096,
-                    },
-                    "tagIds": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "IDs of tags the driver is associated with. Required if API access is scoped by tags.",
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": (
-                            "Home terminal timezone (IANA key, e.g. America/Los_Angeles, America/New_York) "
-                            "for ELD log calculation."
-                        ),
-                    },
-                    "externalIds": {
-                        "type": "object",
-                        "additionalProperties": {"type": "string"},
-                        "description": "External IDs for the driver (e.g. payrollId, maintenanceId).",
-                    },
-                    "locale": {
-                        "type": "string",
-                        "enum": ["us", "at", "be", "ca", "gb", "fr", "de", "ie", "it", "lu", "mx", "nl", "es", "ch", "pr"],
-                        "description": "Locale override (ISO 3166-2 country code).",
-                    },
-                    "eldExempt": {
-                        "type": "boolean",
-                        "description": "Whether the driver is exempt from the Electronic Logging Mandate.",
-                    },
-                    "eldExemptReason": {
-                        "type": "string",
-                        "description": "Reason for ELD exemption if eldExempt is true.",
-                    },
-                    "vehicleGroupTagId": {
-                        "type": "string",
-                        "description": "Tag ID that determines which vehicles the driver sees when selecting vehicles.",
-                    },
-                    "staticAssignedVehicleId": {
-                        "type": "string",
-                        "description": "ID of vehicle the driver is permanently assigned to (uncommon).",
-                    },
-                },
-                "required": ["name", "username", "password"],
-            },
-        ),
-        Tool(
-            name="get_driver",
-            description=(
-                "Retrieve a single driver by ID. Use Samsara driver ID or external ID (e.g. payrollId:ABFS18600). "
-                "Requires Read Drivers scope."
+        },
+        "includeAsset": {
+            "type": "boolean",
+            "description": "Include asset details in response.",
+        },
+        "after": _PROP_AFTER,
+    },
+    "required": ["ids"],
+}
+
+_GET_DRIVERS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "driverActivationStatus": {
+            "type": "string",
+            "enum": _DRIVER_ACTIVATION_STATUSES,
+            "description": (
+                "If 'deactivated', only deactivated drivers are returned. "
+                "Defaults to 'active' if not provided."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "string",
-                        "description": (
-                            "ID of the driver. Samsara ID or external ID in key:value format "
-                            "(e.g. payrollId:ABFS18600)."
-                        ),
-                    },
-                },
-                "required": ["id"],
-            },
-        ),
-        Tool(
-            name="update_driver",
-            description=(
-                "Update a driver by ID. Pass fields to update (e.g. name, phone, driverActivationStatus). "
-                "Use driverActivationStatus='deactivated' to deactivate; optional deactivatedAtTime. "
-                "Requires Write Drivers scope."
+        },
+        "limit": _PROP_LIMIT_512,
+        "after": _PROP_AFTER,
+        "parentTagIds": {
+            "type": "string",
+            "description": "Comma-separated list of parent tag IDs. Example: '345,678'",
+        },
+        "tagIds": _PROP_TAG_IDS,
+        "attributeValueIds": {
+            "type": "string",
+            "description": "Comma-separated list of attribute value IDs.",
+        },
+        "attributes": _PROP_ATTRIBUTES,
+        "updatedAfterTime": _PROP_UPDATED_AFTER_TIME,
+        "createdAfterTime": _PROP_CREATED_AFTER_TIME,
+    },
+}
+
+_CREATE_DRIVER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Driver's full name (1-255 characters).",
+            "maxLength": 255,
+        },
+        "username": {
+            "type": "string",
+            "minLength": 1,
+            "description": (
+                "Driver's login username for the driver app. Must be unique, "
+                "no spaces or '@' (1-189 characters)."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "string",
-                        "description": (
-                            "ID of the driver. Samsara ID or external ID in key:value format "
-                            "(e.g. payrollId:ABFS18600)."
-                        ),
-                    },
-                    "body": {
-                        "type": "object",
-                        "description": "Fields to update (UpdateDriverRequest). e.g. name, phone, notes, driverActivationStatus, deactivatedAtTime.",
-                    },
-                },
-                "required": ["id", "body"],
-            },
-        ),
-        Tool(
-            name="list_gateways",
-            description=(
-                "List all gateways. Optional filter by gateway models and pagination with 'after'. "
-                "Rate limit: 5 requests/sec. Requires Read Gateways scope under Setup & Administration."
+            "maxLength": 189,
+        },
+        "password": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Password for the driver to log into the Samsara driver app.",
+        },
+        "licenseNumber": {
+            "type": "string",
+            "description": "Driver's state-issued license number. With licenseState must be unique.",
+        },
+        "licenseState": {
+            "type": "string",
+            "description": "US state, Canadian province, or US territory abbreviation (e.g. CA).",
+        },
+        "phone": {
+            "type": "string",
+            "description": "Driver's phone number (max 255 characters).",
+            "maxLength": 255,
+        },
+        "notes": {
+            "type": "string",
+            "description": "Notes about the driver (max 4096 characters).",
+            "maxLength": 4096,
+        },
+        "tagIds": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "IDs of tags the driver is associated with. Required if API access is scoped by tags.",
+        },
+        "timezone": {
+            "type": "string",
+            "description": (
+                "Home terminal timezone (IANA key, e.g. America/Los_Angeles, America/New_York) "
+                "for ELD log calculation."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "models": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by comma-separated list of gateway models.",
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": (
-                            "Pagination cursor (endCursor) from the previous page of results. "
-                            "When present, returns the next page."
-                        ),
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="list_tags",
-            description=(
-                "List all tags in the organization. Tags are used to group and filter "
-                "vehicles, drivers, and other assets. Supports pagination. "
-                "Requires Read Tags scope under Setup & Administration."
+        },
+        "externalIds": {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+            "description": "External IDs for the driver (e.g. payrollId, maintenanceId).",
+        },
+        "locale": {
+            "type": "string",
+            "enum": _DRIVER_LOCALES,
+            "description": "Locale override (ISO 3166-2 country code).",
+        },
+        "eldExempt": {
+            "type": "boolean",
+            "description": "Whether the driver is exempt from the Electronic Logging Mandate.",
+        },
+        "eldExemptReason": {
+            "type": "string",
+            "description": "Reason for ELD exemption if eldExempt is true.",
+        },
+        "vehicleGroupTagId": {
+            "type": "string",
+            "description": "Tag ID that determines which vehicles the driver sees when selecting vehicles.",
+        },
+        "staticAssignedVehicleId": {
+            "type": "string",
+            "description": "ID of vehicle the driver is permanently assigned to (uncommon).",
+        },
+    },
+    "required": ["name", "username", "password"],
+}
+
+_GET_DRIVER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": "string",
+            "minLength": 1,
+            "description": (
+                "ID of the driver. Samsara ID or external ID in key:value format "
+                "(e.g. payrollId:ABFS18600)."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results (1-512, default 512).",
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": "Pagination cursor from previous response.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="create_tag",
-            description=(
-                "Create a new tag in the organization. Tags can be used to group "
-                "vehicles, drivers, addresses, and other entities. "
-                "Requires Write Tags scope under Setup & Administration."
+        },
+    },
+    "required": ["id"],
+}
+
+_UPDATE_DRIVER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": "string",
+            "minLength": 1,
+            "description": (
+                "ID of the driver. Samsara ID or external ID in key:value format "
+                "(e.g. payrollId:ABFS18600)."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the tag to create.",
-                    },
-                    "parentTagId": {
-                        "type": "string",
-                        "description": "Optional parent tag ID for nested tags.",
-                    },
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="get_speeding_intervals",
-            description=(
-                "Get speeding intervals for trips. Returns speeding data for completed trips "
-                "based on time parameters. Can filter by severity (light, moderate, heavy, severe). "
-                "Rate limit: 5 req/sec. Requires Read Speeding Intervals scope."
+        },
+        "body": {
+            "type": "object",
+            "description": "Fields to update (UpdateDriverRequest). e.g. name, phone, notes, driverActivationStatus, deactivatedAtTime.",
+        },
+    },
+    "required": ["id", "body"],
+}
+
+_LIST_GATEWAYS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "models": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Filter by comma-separated list of gateway models.",
+        },
+        "after": _PROP_AFTER,
+    },
+}
+
+_LIST_TAGS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "limit": _PROP_LIMIT_512,
+        "after": _PROP_AFTER,
+    },
+}
+
+_CREATE_TAG_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Name of the tag to create.",
+        },
+        "parentTagId": {
+            "type": "string",
+            "description": "Optional parent tag ID for nested tags.",
+        },
+    },
+    "required": ["name"],
+}
+
+_GET_SPEEDING_INTERVALS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "assetIds": {
+            "type": "array",
+            "minItems": 1,
+            "items": {"type": "string"},
+            "description": "List of asset IDs (up to 50).",
+        },
+        "startTime": {**_time_prop("for start of query range"), "minLength": 1},
+        "endTime": _time_prop("for end of query range (optional)"),
+        "queryBy": {
+            "type": "string",
+            "enum": _TRIP_TIME_FIELDS,
+            "description": "Compare times against 'updatedAtTime' (default) or 'tripStartTime'.",
+        },
+        "includeAsset": {
+            "type": "boolean",
+            "description": "Include expanded asset data.",
+        },
+        "includeDriverId": {
+            "type": "boolean",
+            "description": "Include driver ID in response.",
+        },
+        "after": _PROP_AFTER,
+        "severityLevels": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Filter by severity: 'light', 'moderate', 'heavy', 'severe'.",
+        },
+        "autoPaginate": {
+            "type": "boolean",
+            "description": (
+                "Follow pagination cursors and return the pages merged into one 'data' "
+                "array (up to 10 pages). The returned pagination is that of the last page fetched."
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "assetIds": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of asset IDs (up to 50).",
-                    },
-                    "startTime": {
-                        "type": "string",
-                        "description": "RFC 3339 timestamp for start of query range.",
-                    },
-                    "endTime": {
-                        "type": "string",
-                        "description": "RFC 3339 timestamp for end of query range (optional).",
-                    },
-                    "queryBy": {
-                        "type": "string",
-                        "enum": ["updatedAtTime", "tripStartTime"],
-                        "description": "Compare times against 'updatedAtTime' (default) or 'tripStartTime'.",
-                    },
-                    "includeAsset": {
-                        "type": "boolean",
-                        "description": "Include expanded asset data.",
-                    },
-                    "includeDriverId": {
-                        "type": "boolean",
-                        "description": "Include driver ID in response.",
-                    },
-                    "after": {
-                        "type": "string",
-                        "description": "Pagination cursor from previous response.",
-                    },
-                    "severityLevels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by severity: 'light', 'moderate', 'heavy', 'severe'.",
-                    },
-                },
-                "required": ["assetIds", "startTime"],
-            },
+        },
+    },
+    "required": ["assetIds", "startTime"],
+}
+
+_GET_SAFETY_SETTINGS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+}
+
+_GET_ORG_INFO_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+}
+
+
+# Tool definitions are built once at import; list_tools() hands out the same list
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_vehicles",
+        description=(
+            "List all vehicles from the Samsara fleet. "
+            "Supports filtering by tags, attributes, and time ranges. "
+            "Rate limit: 25 requests/sec."
         ),
-        Tool(
-            name="get_safety_settings",
-            description=(
-                "Get safety settings for the organization. Includes harsh event sensitivity, "
-                "in-cab alerts, and other safety configuration. Rate limit: 5 req/sec. "
-                "Requires Read Safety Events & Scores scope under Safety & Cameras."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+        inputSchema=_LIST_VEHICLES_SCHEMA,
+    ),
+    Tool(
+        name="get_vehicle",
+        description=(
+            "Retrieve a single vehicle by ID. Use Samsara vehicle ID or external ID "
+            "(e.g. maintenanceId:250020 or samsara.vin:1HGBH41JXMN109186). Requires Read Vehicles scope."
         ),
-        Tool(
-            name="get_org_info",
-            description=(
-                "Get information about your organization (e.g. org name, ID, settings). "
-                "No parameters required. Requires Read Org Information scope under Setup & Administration."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+        inputSchema=_GET_VEHICLE_SCHEMA,
+    ),
+    Tool(
+        name="update_vehicle",
+        description=(
+            "Update a vehicle by ID. Pass only the fields to update (e.g. name, notes, tagIds). "
+            "No required fields in body. Requires Write Vehicles scope."
+        ),
+        inputSchema=_UPDATE_VEHICLE_SCHEMA,
+    ),
+    Tool(
+        name="get_asset_locations",
+        description=(
+            "Get current location and speed data for assets. "
+            "Returns GPS coordinates, optional street addresses, and speed. "
+            "Use includeReverseGeo=true to get human-readable addresses. "
+            "By default, returns recent data (last 5 minutes) with addresses and speed included."
+        ),
+        inputSchema=_GET_ASSET_LOCATIONS_SCHEMA,
+    ),
+    Tool(
+        name="get_safety_events",
+        description=(
+            "Get safety events like harsh braking, speeding, collisions, drowsiness, "
+            "mobile usage, and seatbelt violations. Requires a start time. "
+            "Use behaviorLabels to filter by event type, eventStates to filter by coaching status. "
+            "Set includeDriver=true and includeAsset=true to get full context. "
+            "By default, returns events from the last 7 days with driver and asset details included."
+        ),
+        inputSchema=_GET_SAFETY_EVENTS_SCHEMA,
+    ),
+    Tool(
+        name="get_safety_events_by_id",
+        description=(
+            "Get details for specified safety events by ID. Requires a list of safety event IDs (UUIDs). "
+            "Use get_safety_events (stream) first to discover event IDs. "
+            "Optional: includeAsset, includeDriver, includeVgOnlyEvents for expanded data; after for pagination. "
+            "Rate limit: 5 requests/sec. Scope: Read Safety Events & Scores (Safety & Cameras)."
+        ),
+        inputSchema=_GET_SAFETY_EVENTS_BY_ID_SCHEMA,
+    ),
+    Tool(
+        name="get_trips",
+        description=(
+            "Get trip history for specific vehicles. Returns trip start/end times, "
+            "locations, distance, and duration. Requires asset IDs - use list_vehicles "
+            "first to get IDs if needed. Use completionStatus='inProgress' to see active "
+            "trips, 'completed' for finished trips. "
+            "By default, returns trips from the last 7 days with asset details included."
+        ),
+        inputSchema=_GET_TRIPS_SCHEMA,
+    ),
+    Tool(
+        name="get_drivers",
+        description=(
+            "List all drivers in the organization. "
+            "Use driverActivationStatus='active' (default) or 'deactivated'. "
+            "Supports filtering by tags, attributes, and time ranges. "
+            "Use 'after' with endCursor from previous response for pagination. "
+            "Requires Read Drivers scope."
+        ),
+        inputSchema=_GET_DRIVERS_SCHEMA,
+    ),
+    Tool(
+        name="create_driver",
+        description=(
+            "Create a new driver in the organization. "
+            "Requires name, password, and username. Username must be unique and cannot contain spaces or '@'. "
+            "Optional: licenseNumber, licenseState, phone, notes, tagIds, timezone, externalIds, etc. "
+            "Requires Write Drivers scope."
+        ),
+        inputSchema=_CREATE_DRIVER_SCHEMA,
+    ),
+    Tool(
+        name="get_driver",
+        description=(
+            "Retrieve a single driver by ID. Use Samsara driver ID or external ID (e.g. payrollId:ABFS18600). "
+            "Requires Read Drivers scope."
+        ),
+        inputSchema=_GET_DRIVER_SCHEMA,
+    ),
+    Tool(
+        name="update_driver",
+        description=(
+            "Update a driver by ID. Pass fields to update (e.g. name, phone, driverActivationStatus). "
+            "Use driverActivationStatus='deactivated' to deactivate; optional deactivatedAtTime. "
+            "Requires Write Drivers scope."
+        ),
+        inputSchema=_UPDATE_DRIVER_SCHEMA,
+    ),
+    Tool(
+        name="list_gateways",
+        description=(
+            "List all gateways. Optional filter by gateway models and pagination with 'after'. "
+            "Rate limit: 5 requests/sec. Requires Read Gateways scope under Setup & Administration."
+        ),
+        inputSchema=_LIST_GATEWAYS_SCHEMA,
+    ),
+    Tool(
+        name="list_tags",
+        description=(
+            "List all tags in the organization. Tags are used to group and filter "
+            "vehicles, drivers, and other assets. Supports pagination. "
+            "Requires Read Tags scope under Setup & Administration."
+        ),
+        inputSchema=_LIST_TAGS_SCHEMA,
+    ),
+    Tool(
+        name="create_tag",
+        description=(
+            "Create a new tag in the organization. Tags can be used to group "
+            "vehicles, drivers, addresses, and other entities. "
+            "Requires Write Tags scope under Setup & Administration."
         ),
-    ]
+        inputSchema=_CREATE_TAG_SCHEMA,
+    ),
+    Tool(
+        name="get_speeding_intervals",
+        description=(
+            "Get speeding intervals for trips. Returns speeding data for completed trips "
+            "based on time parameters. Can filter by severity (light, moderate, heavy, severe). "
+            "Rate limit: 5 req/sec. Requires Read Speeding Intervals scope."
+        ),
+        inputSchema=_GET_SPEEDING_INTERVALS_SCHEMA,
+    ),
+    Tool(
+        name="get_safety_settings",
+        description=(
+            "Get safety settings for the organization. Includes harsh event sensitivity, "
+            "in-cab alerts, and other safety configuration. Rate limit: 5 req/sec. "
+            "Requires Read Safety Events & Scores scope under Safety & Cameras."
+        ),
+        inputSchema=_GET_SAFETY_SETTINGS_SCHEMA,
+    ),
+    Tool(
+        name="get_org_info",
+        description=(
+            "Get information about your organization (e.g. org name, ID, settings). "
+            "No parameters required. Requires Read Org Information scope under Setup & Administration."
+        ),
+        inputSchema=_GET_ORG_INFO_SCHEMA,
+    ),
+]
+
+
+def _compile_validator(schema: dict[str, Any]) -> jsonschema.protocols.Validator:
+    """Check a tool inputSchema once and return a reusable validator for it."""
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Argument validators compiled once per tool. call_tool validates against these
+# instead of the SDK's per-call jsonschema.validate(), which re-checks the schema
+# and rebuilds a validator on every request.
+_VALIDATORS: dict[str, jsonschema.protocols.Validator] = {
+    tool.name: _compile_validator(tool.inputSchema) for tool in _TOOLS
+}
+
+
+class _RateLimiter:
+    """
+    GCRA rate limiter admitting at most `rate` calls per second.
+
+    Up to `rate` calls pass immediately (a one-second burst); further callers
+    reserve the next slot and sleep until it arrives, so bursts are smoothed to
+    the endpoint's limit instead of failing with 429s.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._tolerance = self._interval * (rate - 1)
+        self._tat = 0.0  # theoretical arrival time of the next call
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed under the rate limit."""
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        self._tat = tat + self._interval
+        delay = tat - self._tolerance - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def back_off(self, seconds: float) -> None:
+        """Hold off all further calls for `seconds` after the API answered 429."""
+        self._tat = max(self._tat, time.monotonic() + seconds + self._tolerance)
+
+
+# Documented Samsara rate limits (requests/sec) for the endpoints behind each tool.
+# Tools not listed get the general API limit.
+_DEFAULT_RATE_LIMIT = 25
+_RATE_LIMITS: dict[str, float] = {
+    "get_safety_events_by_id": 5,
+    "list_gateways": 5,
+    "get_speeding_intervals": 5,
+    "get_safety_settings": 5,
+}
+
+# Every tool is throttled client-side, so bursts wait instead of drawing 429s
+_RATE_LIMITERS: dict[str, _RateLimiter] = {
+    tool.name: _RateLimiter(_RATE_LIMITS.get(tool.name, _DEFAULT_RATE_LIMIT))
+    for tool in _TOOLS
+}
+
+
+# Fixed parts of the error text returned for Samsara client exceptions
+_ERROR_PREFIX = "Error: "
+_UNEXPECTED_ERROR_PREFIX = "Unexpected error: "
+_RESPONSE_DETAILS_PREFIX = "\n\nResponse details: "
+_RETRY_AFTER_TEMPLATE = "\n\nPlease wait {} second{} before retrying."
+# Error bodies longer than this are cut off; the client only needs the gist
+_MAX_ERROR_DETAILS = 4096
+_TRUNCATED_SUFFIX = "... [truncated]"
+
+# Extra guidance appended to validation errors, keyed by (tool, argument)
+_ARGUMENT_HINTS: dict[tuple[str, str], str] = {
+    ("get_trips", "ids"): "Use list_vehicles to find asset IDs.",
+    ("get_speeding_intervals", "assetIds"): "Use list_vehicles to find asset IDs.",
+    ("get_safety_events_by_id", "safetyEventIds"): "Use get_safety_events to discover event IDs.",
+}
+
+
+def _validation_error_text(name: str, e: jsonschema.ValidationError) -> str:
+    """Render a schema violation naming the offending argument, plus any hint for it."""
+    if e.absolute_path:
+        argument = str(e.absolute_path[0])
+        text = f"{_ERROR_PREFIX}Invalid arguments for {name}: {e.json_path[2:]}: {e.message}"
+    else:
+        # A missing required property is reported against the arguments object itself
+        argument = ""
+        if e.validator == "required":
+            argument = next((p for p in e.validator_value if p not in e.instance), "")
+        text = f"{_ERROR_PREFIX}Invalid arguments for {name}: {e.message}"
+    hint = _ARGUMENT_HINTS.get((name, argument))
+    return f"{text}. {hint}" if hint else text
+
+
+# Read-only data that changes rarely is cached briefly so repeated identical
+# calls in a session skip the Samsara round-trip. Per-tool TTLs in seconds; the
+# 60 s listings TTL also keeps cached `after` cursors within Samsara's
+# pagination window.
+_CACHE_TTLS: dict[str, float] = {
+    "list_tags": 60.0,
+    "list_gateways": 60.0,
+    "get_safety_settings": 300.0,
+    "get_org_info": 3600.0,
+}
+_CACHE_MAX_ENTRIES = 256
+_response_cache: dict[tuple, tuple[float, Any]] = {}
+# Bumped by _invalidate_cache; a fetch that started under an older generation
+# is returned to its callers but not cached
+_cache_generations: dict[str, int] = {}
+
+
+def _cache_key(name: str, arguments: dict[str, Any]) -> tuple[str, bytes]:
+    """
+    Build a stable, hashable cache key from a tool name and its arguments.
+
+    The arguments are encoded as canonical JSON rather than converted to tuples,
+    so nested values (including undeclared extra arguments) key like any other.
+    """
+    return (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+
+
+# Requests currently in flight, by cache key. Concurrent identical calls await
+# the same task instead of each sending its own request to Samsara.
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, fetch) -> Any:
+    """Await fetch(), sharing one in-flight request among concurrent callers with the same key."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        # Invalidation may have replaced this entry with a newer fetch already
+        task.add_done_callback(lambda t: _inflight.pop(key) if _inflight.get(key) is t else None)
+    # Shielded so one caller being cancelled does not cancel the others' request
+    return await asyncio.shield(task)
+
+
+async def _cached(name: str, arguments: dict[str, Any], fetch) -> Any:
+    """Return a fresh cached result for this call, or await fetch() and cache it."""
+    key = _cache_key(name, arguments)
+    entry = _response_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    generation = _cache_generations.get(name, 0)
+    result = await _single_flight(key, fetch)
+    if _cache_generations.get(name, 0) != generation:
+        return result
+    # The TTL counts from when the data arrived, not from when the call started
+    now = time.monotonic()
+    _response_cache.pop(key, None)
+    if len(_response_cache) >= _CACHE_MAX_ENTRIES:
+        for stale in [k for k, (expires, _) in _response_cache.items() if expires <= now]:
+            del _response_cache[stale]
+        # Still full of live entries: evict the oldest (dicts keep insertion order)
+        while len(_response_cache) >= _CACHE_MAX_ENTRIES:
+            del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (now + _CACHE_TTLS[name], result)
+    return result
+
+
+# Tools whose results may be served from the cache or an identical in-flight call
+_SHARED_RESULT_TOOLS = frozenset((*_CACHE_TTLS, "get_speeding_intervals"))
+
+
+async def _resolved(result: Any) -> Any:
+    """Return result; lets an already-known value be awaited like a handler call."""
+    return result
+
+
+def _shared_result(name: str, arguments: dict[str, Any]) -> Awaitable[Any] | None:
+    """Return an awaitable for a cached or in-flight result of this call, if there is one."""
+    if name not in _SHARED_RESULT_TOOLS:
+        return None
+    key = _cache_key(name, arguments)
+    entry = _response_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return _resolved(entry[1])
+    task = _inflight.get(key)
+    return asyncio.shield(task) if task is not None else None
+
+
+def _invalidate_cache(name: str) -> None:
+    """Drop all cached and in-flight results for a tool after a write to its resource."""
+    _cache_generations[name] = _cache_generations.get(name, 0) + 1
+    for key in [k for k in _response_cache if k[0] == name]:
+        del _response_cache[key]
+    # Later callers start a fresh request instead of joining one that predates the write
+    for key in [k for k in _inflight if k[0] == name]:
+        del _inflight[key]
+
+
+# Backpressure: at most _MAX_CONCURRENT_TOOLS calls run at once and at most
+# _MAX_PENDING_TOOLS are admitted (running or waiting); beyond that, calls are
+# rejected immediately instead of piling up coroutines and argument dicts.
+_TOOL_SEM = asyncio.Semaphore(_MAX_CONCURRENT_TOOLS)
+_pending_tools = 0
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
-    """Handle tool calls."""
-    client = get_samsara_client()
-    
-    if name == "list_vehicles":
-        try:
-            # Extract parameters from arguments
-            limit = arguments.get("limit")
-            after = arguments.get("after")
-            parent_tag_ids = arguments.get("parentTagIds")
-            tag_ids = arguments.get("tagIds")
-            attribute_value_ids = arguments.get("attributeValueIds")
-            attributes = arguments.get("attributes")
-            updated_after_time = arguments.get("updatedAfterTime")
-            created_after_time = arguments.get("createdAfterTime")
-            
-            # Call the Samsara API
-            result = await client.list_vehicles(
-                limit=limit,
-                after=after,
-                parent_tag_ids=parent_tag_ids,
-                tag_ids=tag_ids,
-                attribute_value_ids=attribute_value_ids,
-                attributes=attributes,
-                updated_after_time=updated_after_time,
-                created_after_time=created_after_time,
-            )
-            
-            # Return the result as JSON text
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-            
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-            
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-            
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-            
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_vehicle":
-        try:
-            id = arguments.get("id")
-            if not id:
-                return [TextContent(
-                    type="text",
-                    text="Error: get_vehicle requires 'id'."
-                )]
-            result = await client.get_vehicle(id=id)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "update_vehicle":
-        try:
-            id = arguments.get("id")
-            body = arguments.get("body") or {}
-            if not id:
-                return [TextContent(
-                    type="text",
-                    text="Error: update_vehicle requires 'id'."
-                )]
-            result = await client.update_vehicle(id=id, vehicle=body)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_asset_locations":
-        try:
-            # Extract parameters from arguments
-            after = arguments.get("after")
-            limit = arguments.get("limit")
-            start_time = arguments.get("startTime")
-            end_time = arguments.get("endTime")
-            ids = arguments.get("ids")
-            include_speed = arguments.get("includeSpeed")
-            include_reverse_geo = arguments.get("includeReverseGeo")
-            include_geofence_lookup = arguments.get("includeGeofenceLookup")
-            include_high_frequency_locations = arguments.get("includeHighFrequencyLocations")
-            include_external_ids = arguments.get("includeExternalIds")
-
-            # Default behavior: when no time range specified, get last 5 minutes
-            # with includeReverseGeo=true and includeSpeed=true
-            if start_time is None and end_time is None:
-                now = datetime.now(timezone.utc)
-                start_time = (now - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
-                end_time = now.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            if include_reverse_geo is None:
-                include_reverse_geo = True
-
-            if include_speed is None:
-                include_speed = True
-
-            # Call the Samsara API
-            result = await client.get_asset_locations(
-                after=after,
-                limit=limit,
-                start_time=start_time,
-                end_time=end_time,
-                ids=ids,
-                include_speed=include_speed,
-                include_reverse_geo=include_reverse_geo,
-                include_geofence_lookup=include_geofence_lookup,
-                include_high_frequency_locations=include_high_frequency_locations,
-                include_external_ids=include_external_ids,
-            )
-
-            # Return the result as JSON text
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_safety_events":
-        try:
-            # Extract parameters from arguments
-            start_time = arguments.get("startTime")
-            end_time = arguments.get("endTime")
-            query_by_time_field = arguments.get("queryByTimeField")
-            asset_ids = arguments.get("assetIds")
-            driver_ids = arguments.get("driverIds")
-            tag_ids = arguments.get("tagIds")
-            assigned_coaches = arguments.get("assignedCoaches")
-            behavior_labels = arguments.get("behaviorLabels")
-            event_states = arguments.get("eventStates")
-            include_asset = arguments.get("includeAsset")
-            include_driver = arguments.get("includeDriver")
-            include_vg_only_events = arguments.get("includeVgOnlyEvents")
-            after = arguments.get("after")
-
-            # Default behavior: when no start time specified, default to 7 days ago
-            # with includeDriver=true and includeAsset=true for context
-            if start_time is None:
-                now = datetime.now(timezone.utc)
-                start_time = (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            if include_driver is None:
-                include_driver = True
-
-            if include_asset is None:
-                include_asset = True
-
-            # Call the Samsara API
-            result = await client.get_safety_events(
-                start_time=start_time,
-                end_time=end_time,
-                query_by_time_field=query_by_time_field,
-                asset_ids=asset_ids,
-                driver_ids=driver_ids,
-                tag_ids=tag_ids,
-                assigned_coaches=assigned_coaches,
-                behavior_labels=behavior_labels,
-                event_states=event_states,
-                include_asset=include_asset,
-                include_driver=include_driver,
-                include_vg_only_events=include_vg_only_events,
-                after=after,
-            )
-
-            # Return the result as JSON text
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_safety_events_by_id":
-        try:
-            safety_event_ids_arg = arguments.get("safetyEventIds")
-            if not safety_event_ids_arg:
-                return [TextContent(
-                    type="text",
-                    text="Error: 'safetyEventIds' is required. Provide a list of safety event IDs (UUIDs). Use get_safety_events to discover event IDs."
-                )]
-            if isinstance(safety_event_ids_arg, list):
-                safety_event_ids = [str(x) for x in safety_event_ids_arg]
-            else:
-                safety_event_ids = [s.strip() for s in str(safety_event_ids_arg).split(",") if s.strip()]
-            include_asset = arguments.get("includeAsset")
-            include_driver = arguments.get("includeDriver")
-            include_vg_only_events = arguments.get("includeVgOnlyEvents")
-            after = arguments.get("after")
-
-            result = await client.get_safety_events_by_id(
-                safety_event_ids=safety_event_ids,
-                include_asset=include_asset,
-                include_driver=include_driver,
-                include_vg_only_events=include_vg_only_events,
-                after=after,
-            )
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_trips":
-        try:
-            # Extract parameters from arguments
-            ids = arguments.get("ids")
-            start_time = arguments.get("startTime")
-            end_time = arguments.get("endTime")
-            query_by = arguments.get("queryBy")
-            completion_status = arguments.get("completionStatus")
-            include_asset = arguments.get("includeAsset")
-            after = arguments.get("after")
-
-            # Validate required parameter
-            if not ids:
-                return [TextContent(
-                    type="text",
-                    text="Error: 'ids' parameter is required. Use list_vehicles to find asset IDs."
-                )]
-
-            # Default behavior: when no start time specified, default to 7 days ago
-            # with includeAsset=true for context
-            if start_time is None:
-                now = datetime.now(timezone.utc)
-                start_time = (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            if include_asset is None:
-                include_asset = True
-
-            # Call the Samsara API
-            result = await client.get_trips(
-                ids=ids,
-                start_time=start_time,
-                end_time=end_time,
-                query_by=query_by,
-                completion_status=completion_status,
-                include_asset=include_asset,
-                after=after,
-            )
-
-            # Return the result as JSON text
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_drivers":
-        try:
-            driver_activation_status = arguments.get("driverActivationStatus")
-            limit = arguments.get("limit")
-            after = arguments.get("after")
-            parent_tag_ids = arguments.get("parentTagIds")
-            tag_ids = arguments.get("tagIds")
-            attribute_value_ids = arguments.get("attributeValueIds")
-            attributes = arguments.get("attributes")
-            updated_after_time = arguments.get("updatedAfterTime")
-            created_after_time = arguments.get("createdAfterTime")
-
-            result = await client.list_drivers(
-                driver_activation_status=driver_activation_status,
-                limit=limit,
-                after=after,
-                parent_tag_ids=parent_tag_ids,
-                tag_ids=tag_ids,
-                attribute_value_ids=attribute_value_ids,
-                attributes=attributes,
-                updated_after_time=updated_after_time,
-                created_after_time=created_after_time,
-            )
-
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "create_driver":
-        try:
-            # Build driver body from tool arguments (required: name, username, password)
-            name = arguments.get("name")
-            username = arguments.get("username")
-            password = arguments.get("password")
-
-            if not name or not username or not password:
-                return [TextContent(
-                    type="text",
-                    text="Error: create_driver requires 'name', 'username', and 'password'."
-                )]
-
-            driver: dict[str, Any] = {
-                "name": name,
-                "username": username,
-                "password": password,
-            }
-
-            # Optional fields - only include if provided
-            if arguments.get("licenseNumber") is not None:
-                driver["licenseNumber"] = arguments["licenseNumber"]
-            if arguments.get("licenseState") is not None:
-                driver["licenseState"] = arguments["licenseState"]
-            if arguments.get("phone") is not None:
-                driver["phone"] = arguments["phone"]
-            if arguments.get("notes") is not None:
-                driver["notes"] = arguments["notes"]
-            if arguments.get("tagIds") is not None:
-                driver["tagIds"] = arguments["tagIds"]
-            if arguments.get("timezone") is not None:
-                driver["timezone"] = arguments["timezone"]
-            if arguments.get("externalIds") is not None:
-                driver["externalIds"] = arguments["externalIds"]
-            if arguments.get("locale") is not None:
-                driver["locale"] = arguments["locale"]
-            if arguments.get("eldExempt") is not None:
-                driver["eldExempt"] = arguments["eldExempt"]
-            if arguments.get("eldExemptReason") is not None:
-                driver["eldExemptReason"] = arguments["eldExemptReason"]
-            if arguments.get("vehicleGroupTagId") is not None:
-                driver["vehicleGroupTagId"] = arguments["vehicleGroupTagId"]
-            if arguments.get("staticAssignedVehicleId") is not None:
-                driver["staticAssignedVehicleId"] = arguments["staticAssignedVehicleId"]
-
-            result = await client.create_driver(driver)
-
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_driver":
-        try:
-            id = arguments.get("id")
-            if not id:
-                return [TextContent(
-                    type="text",
-                    text="Error: get_driver requires 'id'."
-                )]
-            result = await client.get_driver(id=id)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "update_driver":
-        try:
-            id = arguments.get("id")
-            body = arguments.get("body") or {}
-            if not id:
-                return [TextContent(
-                    type="text",
-                    text="Error: update_driver requires 'id'."
-                )]
-            result = await client.update_driver(id=id, driver=body)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "list_gateways":
-        try:
-            models = arguments.get("models")
-            after = arguments.get("after")
-            result = await client.list_gateways(models=models, after=after)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "list_tags":
-        try:
-            limit = arguments.get("limit")
-            after = arguments.get("after")
-
-            result = await client.list_tags(
-                limit=limit,
-                after=after,
-            )
-
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "create_tag":
-        try:
-            tag_name = arguments.get("name")
-            if not tag_name:
-                return [TextContent(
-                    type="text",
-                    text="Error: 'name' is required to create a tag."
-                )]
-
-            body = {"name": tag_name}
-            if arguments.get("parentTagId"):
-                body["parentTagId"] = arguments["parentTagId"]
-
-            result = await client.create_tag(body)
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_speeding_intervals":
-        try:
-            asset_ids = arguments.get("assetIds")
-            start_time = arguments.get("startTime")
-            end_time = arguments.get("endTime")
-            query_by = arguments.get("queryBy")
-            include_asset = arguments.get("includeAsset")
-            include_driver_id = arguments.get("includeDriverId")
-            after = arguments.get("after")
-            severity_levels = arguments.get("severityLevels")
-
-            if not asset_ids or not start_time:
-                return [TextContent(
-                    type="text",
-                    text="Error: get_speeding_intervals requires 'assetIds' and 'startTime'."
-                )]
-
-            result = await client.get_speeding_intervals(
-                asset_ids=asset_ids,
-                start_time=start_time,
-                end_time=end_time,
-                query_by=query_by,
-                include_asset=include_asset,
-                include_driver_id=include_driver_id,
-                after=after,
-                severity_levels=severity_levels,
-            )
-
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_safety_settings":
-        try:
-            result = await client.get_safety_settings()
-
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
-
-    elif name == "get_org_info":
-        try:
-            result = await client.get_organization_info()
-            import json
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        except SamsaraRateLimitError as e:
-            error_message = str(e)
-            if e.retry_after:
-                error_message += f"\n\nPlease wait {e.retry_after} seconds before retrying."
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraAPIError as e:
-            error_message = str(e)
-            if e.response_body:
-                import json
-                error_message += f"\n\nResponse details: {json.dumps(e.response_body, indent=2)}"
-            return [TextContent(type="text", text=f"Error: {error_message}")]
-        except SamsaraError as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Unexpected error: {type(e).__name__}: {str(e)}"
-            )]
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+async def call_tool(
+    name: str, arguments: dict[str, Any]
+) -> Sequence[TextContent] | CallToolResult:
+    """Handle tool calls. Calls rejected before reaching the API come back with isError set."""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        logger.warning("Unknown tool requested: %s", name)
+        return _error_result(f"{_ERROR_PREFIX}Unknown tool: {name}")
 
+    try:
+        _VALIDATORS[name].validate(arguments)
+    except jsonschema.ValidationError as e:
+        return _error_result(_validation_error_text(name, e))
+
+    global _pending_tools
+    if _pending_tools >= _MAX_PENDING_TOOLS:
+        return _error_result(
+            f"{_ERROR_PREFIX}Server overloaded ({_pending_tools} tool calls pending)."
+            + _retry_after_text(1)
+        )
+
+    _pending_tools += 1
+    try:
+        limiter = _RATE_LIMITERS[name]
+        # Cache hits and calls joining an identical in-flight request never reach
+        # the API, so they take neither a token nor a slot
+        shared = _shared_result(name, arguments)
+        if shared is not None:
+            return await _invoke(shared, limiter)
+
+        # Only calls that will reach the API touch the client
+        client = get_samsara_client()
+        # Throttle before taking a slot, so calls sleeping on the limiter (or a
+        # 429 back-off) leave the slots to other tools
+        await limiter.acquire()
+        async with _TOOL_SEM:
+            return await _invoke(handler(client, arguments), limiter)
+    finally:
+        _pending_tools -= 1
+
+
+# Default query windows, in seconds, for tools called without a time range
+_RECENT_LOCATIONS_WINDOW = 5 * 60
+_DEFAULT_LOOKBACK = 7 * 24 * 60 * 60
+
+
+def _rfc3339(epoch_seconds: float) -> str:
+    """Format a Unix timestamp as an RFC 3339 UTC string (e.g. 2019-06-13T19:08:25Z)."""
+    year, month, day, hour, minute, second, *_ = time.gmtime(epoch_seconds)
+    return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}Z"
+
+
+@functools.lru_cache(maxsize=8)
+def _default_window(now_seconds: int, window_seconds: int) -> tuple[str, str]:
+    """
+    Return (start, end) RFC 3339 timestamps for the window ending at now_seconds.
+
+    Keyed on whole seconds, so a burst of calls within the same second reuses
+    the formatted strings.
+    """
+    return _rfc3339(now_seconds - window_seconds), _rfc3339(now_seconds)
+
+
+def _text(text: str) -> TextContent:
+    """Build a text content block without re-validating its constant `type` field."""
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _error_result(text: str) -> CallToolResult:
+    """Wrap error text in a tool result flagged isError, as the SDK does for its own checks."""
+    return CallToolResult(content=[_text(text)], isError=True)
+
+
+# Indentation is opt-in (SAMSARA_PRETTY_JSON=1) for debugging by hand
+_DUMPS_OPTION = orjson.OPT_INDENT_2 if _PRETTY_JSON else None
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a Samsara response as JSON text, compact unless SAMSARA_PRETTY_JSON is set.
+
+    Tool results are read by the model, not by people, so indentation only
+    adds bytes and tokens to every response.
+    """
+    return orjson.dumps(obj, option=_DUMPS_OPTION).decode()
+
+
+# Tool name -> handler, filled in by @_tool_handler and looked up once per call
+TOOL_HANDLERS: dict[str, Callable[[SamsaraClient, dict[str, Any]], Awaitable[Any]]] = {}
+
+
+def _tool_handler(name: str):
+    """Register the decorated coroutine as the handler for tool `name`."""
+    def register(handler):
+        TOOL_HANDLERS[name] = handler
+        return handler
+    return register
+
+
+def _retry_after_text(seconds: int) -> str:
+    """Render the retry hint appended to error text, with "second" pluralized to match."""
+    return _RETRY_AFTER_TEMPLATE.format(seconds, "" if seconds == 1 else "s")
+
+
+@functools.lru_cache(maxsize=64)
+def _rate_limit_text(message: str, retry_after: int | None) -> str:
+    """
+    Render a 429 error. Cached because concurrent calls caught in the same
+    rate-limit storm get identical messages and Retry-After values.
+    """
+    if retry_after:
+        return _ERROR_PREFIX + message + _retry_after_text(retry_after)
+    return _ERROR_PREFIX + message
+
+
+def _format_error(e: Exception) -> str:
+    """Render an exception raised by a tool handler as the error text returned to the client."""
+    if isinstance(e, SamsaraRateLimitError):
+        return _rate_limit_text(str(e), e.retry_after)
+    if isinstance(e, SamsaraAPIError):
+        if e.response_body:
+            # Prefer the body exactly as Samsara sent it over re-serializing the parsed dict
+            details = e.response_text or _dumps(e.response_body)
+            if len(details) > _MAX_ERROR_DETAILS:
+                details = details[:_MAX_ERROR_DETAILS] + _TRUNCATED_SUFFIX
+            return _ERROR_PREFIX + str(e) + _RESPONSE_DETAILS_PREFIX + details
+        return _ERROR_PREFIX + str(e)
+    if isinstance(e, SamsaraError):
+        return _ERROR_PREFIX + str(e)
+    return f"{_UNEXPECTED_ERROR_PREFIX}{type(e).__name__}: {e}"
+
+
+async def _invoke(call: Awaitable[Any], limiter: _RateLimiter) -> Sequence[TextContent]:
+    """Await a tool handler and return its result, or the error it raised, as text."""
+    try:
+        # Serialized inside the try so an unencodable response is reported too
+        text = _dumps(await call)
+    except Exception as e:
+        if isinstance(e, SamsaraRateLimitError):
+            # Samsara says we are over the limit: pause this tool's callers for
+            # Retry-After (or 1s) instead of letting queued calls draw more 429s
+            limiter.back_off(e.retry_after or 1)
+        return [_text(_format_error(e))]
+    return [_text(text)]
+
+
+@_tool_handler("list_vehicles")
+async def _handle_list_vehicles(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the list_vehicles tool."""
+    # Extract parameters from arguments
+    limit = arguments.get("limit")
+    after = arguments.get("after")
+    parent_tag_ids = arguments.get("parentTagIds")
+    tag_ids = arguments.get("tagIds")
+    attribute_value_ids = arguments.get("attributeValueIds")
+    attributes = arguments.get("attributes")
+    updated_after_time = arguments.get("updatedAfterTime")
+    created_after_time = arguments.get("createdAfterTime")
+
+    # Call the Samsara API
+    return await client.list_vehicles(
+        limit=limit,
+        after=after,
+        parent_tag_ids=parent_tag_ids,
+        tag_ids=tag_ids,
+        attribute_value_ids=attribute_value_ids,
+        attributes=attributes,
+        updated_after_time=updated_after_time,
+        created_after_time=created_after_time,
+    )
+
+
+@_tool_handler("get_vehicle")
+async def _handle_get_vehicle(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_vehicle tool."""
+    id = arguments.get("id")
+    return await client.get_vehicle(id=id)
+
+
+@_tool_handler("update_vehicle")
+async def _handle_update_vehicle(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the update_vehicle tool."""
+    id = arguments.get("id")
+    body = arguments.get("body") or {}
+    return await client.update_vehicle(id=id, vehicle=body)
+
+
+@_tool_handler("get_asset_locations")
+async def _handle_get_asset_locations(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_asset_locations tool."""
+    # Extract parameters from arguments
+    after = arguments.get("after")
+    limit = arguments.get("limit")
+    start_time = arguments.get("startTime")
+    end_time = arguments.get("endTime")
+    ids = arguments.get("ids")
+    include_speed = arguments.get("includeSpeed")
+    include_reverse_geo = arguments.get("includeReverseGeo")
+    include_geofence_lookup = arguments.get("includeGeofenceLookup")
+    include_high_frequency_locations = arguments.get("includeHighFrequencyLocations")
+    include_external_ids = arguments.get("includeExternalIds")
+
+    # Default behavior: when no time range specified, get last 5 minutes
+    # with includeReverseGeo=true and includeSpeed=true
+    if start_time is None and end_time is None:
+        start_time, end_time = _default_window(int(time.time()), _RECENT_LOCATIONS_WINDOW)
+
+    if include_reverse_geo is None:
+        include_reverse_geo = True
+
+    if include_speed is None:
+        include_speed = True
+
+    # Call the Samsara API
+    return await client.get_asset_locations(
+        after=after,
+        limit=limit,
+        start_time=start_time,
+        end_time=end_time,
+        ids=ids,
+        include_speed=include_speed,
+        include_reverse_geo=include_reverse_geo,
+        include_geofence_lookup=include_geofence_lookup,
+        include_high_frequency_locations=include_high_frequency_locations,
+        include_external_ids=include_external_ids,
+    )
+
+
+@_tool_handler("get_safety_events")
+async def _handle_get_safety_events(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_safety_events tool."""
+    # Extract parameters from arguments
+    start_time = arguments.get("startTime")
+    end_time = arguments.get("endTime")
+    query_by_time_field = arguments.get("queryByTimeField")
+    asset_ids = arguments.get("assetIds")
+    driver_ids = arguments.get("driverIds")
+    tag_ids = arguments.get("tagIds")
+    assigned_coaches = arguments.get("assignedCoaches")
+    behavior_labels = arguments.get("behaviorLabels")
+    event_states = arguments.get("eventStates")
+    include_asset = arguments.get("includeAsset")
+    include_driver = arguments.get("includeDriver")
+    include_vg_only_events = arguments.get("includeVgOnlyEvents")
+    after = arguments.get("after")
+
+    # Default behavior: when no start time specified, default to 7 days ago
+    # with includeDriver=true and includeAsset=true for context
+    if start_time is None:
+        start_time, _ = _default_window(int(time.time()), _DEFAULT_LOOKBACK)
+
+    if include_driver is None:
+        include_driver = True
+
+    if include_asset is None:
+        include_asset = True
+
+    # Call the Samsara API
+    return await client.get_safety_events(
+        start_time=start_time,
+        end_time=end_time,
+        query_by_time_field=query_by_time_field,
+        asset_ids=asset_ids,
+        driver_ids=driver_ids,
+        tag_ids=tag_ids,
+        assigned_coaches=assigned_coaches,
+        behavior_labels=behavior_labels,
+        event_states=event_states,
+        include_asset=include_asset,
+        include_driver=include_driver,
+        include_vg_only_events=include_vg_only_events,
+        after=after,
+    )
+
+
+@_tool_handler("get_safety_events_by_id")
+async def _handle_get_safety_events_by_id(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_safety_events_by_id tool."""
+    safety_event_ids_arg = arguments.get("safetyEventIds")
+    if isinstance(safety_event_ids_arg, list):
+        safety_event_ids = [str(x) for x in safety_event_ids_arg]
+    else:
+        safety_event_ids = [s for s in map(str.strip, str(safety_event_ids_arg).split(",")) if s]
+    include_asset = arguments.get("includeAsset")
+    include_driver = arguments.get("includeDriver")
+    include_vg_only_events = arguments.get("includeVgOnlyEvents")
+    after = arguments.get("after")
+
+    return await client.get_safety_events_by_id(
+        safety_event_ids=safety_event_ids,
+        include_asset=include_asset,
+        include_driver=include_driver,
+        include_vg_only_events=include_vg_only_events,
+        after=after,
+    )
+
+
+@_tool_handler("get_trips")
+async def _handle_get_trips(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_trips tool."""
+    # Extract parameters from arguments
+    ids = arguments.get("ids")
+    start_time = arguments.get("startTime")
+    end_time = arguments.get("endTime")
+    query_by = arguments.get("queryBy")
+    completion_status = arguments.get("completionStatus")
+    include_asset = arguments.get("includeAsset")
+    after = arguments.get("after")
+
+    # Default behavior: when no start time specified, default to 7 days ago
+    # with includeAsset=true for context
+    if start_time is None:
+        start_time, _ = _default_window(int(time.time()), _DEFAULT_LOOKBACK)
+
+    if include_asset is None:
+        include_asset = True
+
+    # Call the Samsara API
+    return await client.get_trips(
+        ids=ids,
+        start_time=start_time,
+        end_time=end_time,
+        query_by=query_by,
+        completion_status=completion_status,
+        include_asset=include_asset,
+        after=after,
+    )
+
+
+@_tool_handler("get_drivers")
+async def _handle_get_drivers(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_drivers tool."""
+    driver_activation_status = arguments.get("driverActivationStatus")
+    limit = arguments.get("limit")
+    after = arguments.get("after")
+    parent_tag_ids = arguments.get("parentTagIds")
+    tag_ids = arguments.get("tagIds")
+    attribute_value_ids = arguments.get("attributeValueIds")
+    attributes = arguments.get("attributes")
+    updated_after_time = arguments.get("updatedAfterTime")
+    created_after_time = arguments.get("createdAfterTime")
+
+    return await client.list_drivers(
+        driver_activation_status=driver_activation_status,
+        limit=limit,
+        after=after,
+        parent_tag_ids=parent_tag_ids,
+        tag_ids=tag_ids,
+        attribute_value_ids=attribute_value_ids,
+        attributes=attributes,
+        updated_after_time=updated_after_time,
+        created_after_time=created_after_time,
+    )
+
+
+# Optional create_driver arguments passed through to the driver body when set
+_OPTIONAL_DRIVER_FIELDS = (
+    "licenseNumber",
+    "licenseState",
+    "phone",
+    "notes",
+    "tagIds",
+    "timezone",
+    "externalIds",
+    "locale",
+    "eldExempt",
+    "eldExemptReason",
+    "vehicleGroupTagId",
+    "staticAssignedVehicleId",
+)
+
+
+@_tool_handler("create_driver")
+async def _handle_create_driver(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the create_driver tool."""
+    # Build driver body from tool arguments (required: name, username, password)
+    name = arguments.get("name")
+    username = arguments.get("username")
+    password = arguments.get("password")
+
+    driver: dict[str, Any] = {
+        "name": name,
+        "username": username,
+        "password": password,
+        # Optional fields - only include if provided
+        **{
+            key: value
+            for key in _OPTIONAL_DRIVER_FIELDS
+            if (value := arguments.get(key)) is not None
+        },
+    }
+
+    return await client.create_driver(driver)
+
+
+@_tool_handler("get_driver")
+async def _handle_get_driver(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_driver tool."""
+    id = arguments.get("id")
+    return await client.get_driver(id=id)
+
+
+@_tool_handler("update_driver")
+async def _handle_update_driver(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the update_driver tool."""
+    id = arguments.get("id")
+    body = arguments.get("body") or {}
+    return await client.update_driver(id=id, driver=body)
+
+
+@_tool_handler("list_gateways")
+async def _handle_list_gateways(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the list_gateways tool."""
+    models = arguments.get("models")
+    after = arguments.get("after")
+    return await _cached(
+        "list_gateways", arguments,
+        lambda: client.list_gateways(models=models, after=after),
+    )
+
+
+@_tool_handler("list_tags")
+async def _handle_list_tags(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the list_tags tool."""
+    limit = arguments.get("limit")
+    after = arguments.get("after")
+
+    return await _cached(
+        "list_tags", arguments,
+        lambda: client.list_tags(limit=limit, after=after),
+    )
+
+
+@_tool_handler("create_tag")
+async def _handle_create_tag(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the create_tag tool."""
+    tag_name = arguments.get("name")
+
+    body = {"name": tag_name}
+    if arguments.get("parentTagId"):
+        body["parentTagId"] = arguments["parentTagId"]
+
+    result = await client.create_tag(body)
+    _invalidate_cache("list_tags")
+    return result
+
+
+# get_speeding_intervals arguments and the client keyword each one maps to
+_SPEEDING_ARGS = (
+    ("assetIds", "asset_ids"),
+    ("startTime", "start_time"),
+    ("endTime", "end_time"),
+    ("queryBy", "query_by"),
+    ("includeAsset", "include_asset"),
+    ("includeDriverId", "include_driver_id"),
+    ("after", "after"),
+    ("severityLevels", "severity_levels"),
+)
+
+# Upper bound on pages fetched for one autoPaginate call
+_AUTO_PAGINATE_MAX_PAGES = 10
+
+
+async def _paginate(
+    fetch: Callable[..., Awaitable[Any]], kwargs: dict[str, Any], limiter: _RateLimiter
+) -> Any:
+    """Fetch pages by following endCursor and return them merged into one response."""
+    page = await fetch(**kwargs)
+    data = list(page.get("data", []))
+    for _ in range(_AUTO_PAGINATE_MAX_PAGES - 1):
+        pagination = page.get("pagination") or {}
+        if not pagination.get("hasNextPage"):
+            break
+        # Each extra page is another API request, so it waits its turn too
+        await limiter.acquire()
+        page = await fetch(**{**kwargs, "after": pagination["endCursor"]})
+        data.extend(page.get("data", []))
+    return {**page, "data": data}
+
+
+@_tool_handler("get_speeding_intervals")
+async def _handle_get_speeding_intervals(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_speeding_intervals tool."""
+    kwargs = {param: arguments.get(key) for key, param in _SPEEDING_ARGS}
+    if arguments.get("autoPaginate"):
+        fetch = lambda: _paginate(
+            client.get_speeding_intervals, kwargs, _RATE_LIMITERS["get_speeding_intervals"]
+        )
     else:
-        raise ValueError(f"Unknown tool: {name}")
+        fetch = lambda: client.get_speeding_intervals(**kwargs)
+    return await _single_flight(_cache_key("get_speeding_intervals", arguments), fetch)
+
+
+@_tool_handler("get_safety_settings")
+async def _handle_get_safety_settings(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_safety_settings tool."""
+    return await _cached("get_safety_settings", arguments, client.get_safety_settings)
+
+
+@_tool_handler("get_org_info")
+async def _handle_get_org_info(
+    client: SamsaraClient, arguments: dict[str, Any]
+) -> Any:
+    """Handle the get_org_info tool."""
+    return await _cached("get_org_info", arguments, client.get_organization_info)
+
+
+# The MCP server instance is created on first use (from main), so importing
+# this module for its tool definitions does not build the server machinery
+_server: Server | None = None
+
+
+def get_server() -> Server:
+    """Get or create the MCP server instance with the tool handlers registered."""
+    global _server
+    if _server is None:
+        _server = Server("samsara-mcp-server")
+        _server.list_tools()(list_tools)
+        _server.call_tool(validate_input=False)(call_tool)
+    return _server
 
 
 async def main():
@@ -1540,8 +1491,14 @@ async def main():
         print(f"ERROR: Failed to initialize Samsara client: {str(e)}", file=sys.stderr)
         sys.exit(1)
     
-    # Run the server with stdio transport
-    async with stdio_server() as (read_stream, write_stream):
+    # Run the server with stdio transport. Imported here so that importing this
+    # module (tests, schema tooling) does not pull in the transport stack.
+    from mcp.server.stdio import stdio_server
+
+    server = get_server()
+    # The cached client holds one connection pool for the server's lifetime;
+    # close it on shutdown so pooled connections are released cleanly.
+    async with get_samsara_client(), stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
             write_stream,
@@ -1549,6 +1506,17 @@ async def main():
         )
 
 
+def _loop_factory():
+    """Return uvloop's event loop factory when available, else None (stdlib loop)."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_loop_factory())
 
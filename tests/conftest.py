@@ -1,15 +1,12 @@
 """
-Shared pytest fixtures for samsara-mcp-server tests.
+Shared sample data for samsara-mcp-server tests.
 
-Provides mock SamsaraClient and sample API response data—no real HTTP calls.
+Provides sample API response data—no real HTTP calls. The HTTP client mocks
+live with the tests that use them, in test_samsara_client.py.
 """
 
-import pytest
-from unittest.mock import AsyncMock, MagicMock
 from typing import Any
 
-from samsara_client import SamsaraClient
-
 
 # ---------------------------------------------------------------------------
 # Sample API response data (matches Samsara API shapes)
@@ -209,140 +206,3 @@ SAMPLE_SPEEDING_INTERVALS_RESPONSE: dict[str, Any] = {
     ],
     "pagination": {"endCursor": "cursor-speed", "hasNextPage": False},
 }
-
-
-# ---------------------------------------------------------------------------
-# Mock SamsaraClient (no real HTTP)
-# ---------------------------------------------------------------------------
-
-@pytest.fixture
-def mock_httpx_client():
-    """Mock httpx.AsyncClient used by SamsaraClient. No real HTTP calls."""
-    client = AsyncMock()
-    # Default: successful JSON response
-    client.get = AsyncMock(return_value=MagicMock(
-        status_code=200,
-        json=MagicMock(return_value=SAMPLE_VEHICLES_RESPONSE),
-        headers={},
-        text="",
-    ))
-    client.post = AsyncMock(return_value=MagicMock(
-        status_code=200,
-        json=MagicMock(return_value=SAMPLE_CREATE_DRIVER_RESPONSE),
-        headers={},
-        text="",
-    ))
-    return client
-
-
-@pytest.fixture
-def mock_samsara_client(mock_httpx_client):
-    """
-    A SamsaraClient whose HTTP client is replaced with a mock.
-    Use patch to inject mock_httpx_client before SamsaraClient() is created.
-    """
-    # Caller should patch httpx.AsyncClient to return mock_httpx_client,
-    # then instantiate SamsaraClient(api_token="test-token").
-    return mock_httpx_client
-
-
-@pytest.fixture
-def sample_vehicles_response():
-    """Sample GET /fleet/vehicles response."""
-    return SAMPLE_VEHICLES_RESPONSE
-
-
-@pytest.fixture
-def sample_get_vehicle_response():
-    """Sample GET /fleet/vehicles/{id} (single vehicle) response."""
-    return SAMPLE_GET_VEHICLE_RESPONSE
-
-
-@pytest.fixture
-def sample_update_vehicle_response():
-    """Sample PATCH /fleet/vehicles/{id} (updated vehicle) response."""
-    return SAMPLE_UPDATE_VEHICLE_RESPONSE
-
-
-@pytest.fixture
-def sample_locations_response():
-    """Sample GET /assets/location-and-speed/stream response."""
-    return SAMPLE_LOCATIONS_RESPONSE
-
-
-@pytest.fixture
-def sample_safety_events_response():
-    """Sample GET /safety-events/stream response."""
-    return SAMPLE_SAFETY_EVENTS_RESPONSE
-
-
-@pytest.fixture
-def sample_safety_events_by_id_response():
-    """Sample GET /safety-events (by ID) response."""
-    return SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE
-
-
-@pytest.fixture
-def sample_trips_response():
-    """Sample GET /trips/stream response."""
-    return SAMPLE_TRIPS_RESPONSE
-
-
-@pytest.fixture
-def sample_drivers_response():
-    """Sample GET /fleet/drivers response."""
-    return SAMPLE_DRIVERS_RESPONSE
-
-
-@pytest.fixture
-def sample_create_driver_response():
-    """Sample POST /fleet/drivers response."""
-    return SAMPLE_CREATE_DRIVER_RESPONSE
-
-
-@pytest.fixture
-def sample_get_driver_response():
-    """Sample GET /fleet/drivers/{id} (single driver) response."""
-    return SAMPLE_GET_DRIVER_RESPONSE
-
-
-@pytest.fixture
-def sample_update_driver_response():
-    """Sample PATCH /fleet/drivers/{id} (updated driver) response."""
-    return SAMPLE_UPDATE_DRIVER_RESPONSE
-
-
-@pytest.fixture
-def sample_org_info_response():
-    """Sample GET /me (organization info) response."""
-    return SAMPLE_ORG_INFO_RESPONSE
-
-
-@pytest.fixture
-def sample_gateways_response():
-    """Sample GET /gateways response."""
-    return SAMPLE_GATEWAYS_RESPONSE
-
-
-@pytest.fixture
-def sample_list_tags_response():
-    """Sample GET /tags response."""
-    return SAMPLE_LIST_TAGS_RESPONSE
-
-
-@pytest.fixture
-def sample_create_tag_response():
-    """Sample POST /tags response."""
-    return SAMPLE_CREATE_TAG_RESPONSE
-
-
-@pytest.fixture
-def sample_safety_settings_response():
-    """Sample GET /fleet/settings/safety response."""
-    return SAMPLE_SAFETY_SETTINGS_RESPONSE
-
-
-@pytest.fixture
-def sample_speeding_intervals_response():
-    """Sample GET /speeding-intervals/stream response."""
-    return SAMPLE_SPEEDING_INTERVALS_RESPONSE
@@ -1,16 +1,18 @@
 """
 Unit tests for SamsaraClient (samsara_client.py).
 
-All HTTP calls are mocked via unittest.mock.patch on httpx.AsyncClient.
+All HTTP calls go to a stub patched in for httpx.AsyncClient.
 No real API requests are made.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
 from samsara_client import (
+    DEFAULT_LIMITS,
+    HTTP2_AVAILABLE,
     SamsaraClient,
-    SamsaraError,
     SamsaraAPIError,
     SamsaraRateLimitError,
 )
@@ -34,32 +36,233 @@ from tests.conftest import (
     SAMPLE_GATEWAYS_RESPONSE,
 )
 
+# With `pytest -n auto --dist loadgroup`, keep this module on one xdist worker so
+# the module-scoped client fixture is built once rather than once per worker.
+pytestmark = pytest.mark.xdist_group("samsara_client")
+
+# Expected query params, built once at import; read-only so no test can alter
+# another's expectation.
+_P_EMPTY = MappingProxyType({})
+_P_LIST_VEHICLES_FULL = MappingProxyType({
+    "limit": 10,
+    "after": "cursor-1",
+    "parentTagIds": "1,2",
+    "tagIds": "3,4",
+    "attributeValueIds": "uuid-a",
+    "attributes": ["attr:value"],
+    "updatedAfterTime": "2025-01-01T00:00:00Z",
+    "createdAfterTime": "2025-01-02T00:00:00Z",
+})
+_P_GET_ASSET_LOCATIONS_FULL = MappingProxyType({
+    "after": "c1",
+    "limit": 100,
+    "startTime": "2025-01-01T00:00:00Z",
+    "endTime": "2025-01-01T23:59:59Z",
+    "ids": "id1,id2",
+    "includeSpeed": True,
+    "includeReverseGeo": True,
+})
+_P_GET_SAFETY_EVENTS_FULL = MappingProxyType({
+    "startTime": "2025-01-01T00:00:00Z",
+    "endTime": "2025-01-07T00:00:00Z",
+    "queryByTimeField": "createdAtTime",
+    "assetIds": "a1",
+    "driverIds": "d1",
+    "tagIds": "t1",
+    "behaviorLabels": "HarshBraking",
+    "eventStates": "needsReview",
+    "includeAsset": True,
+    "includeDriver": True,
+    "after": "cursor",
+})
+_P_GET_SAFETY_EVENTS_BY_ID_FULL = MappingProxyType({
+    "safetyEventIds": ["evt-uuid-1", "evt-uuid-2"],
+    "includeAsset": True,
+    "includeDriver": True,
+    "after": "cursor-1",
+})
+_P_GET_SAFETY_EVENTS_BY_ID_REQUIRED = MappingProxyType({"safetyEventIds": ["evt-1"]})
+_P_GET_TRIPS_FULL = MappingProxyType({
+    "ids": "id1,id2",
+    "startTime": "2025-01-01T00:00:00Z",
+    "endTime": "2025-01-07T00:00:00Z",
+    "queryBy": "tripStartTime",
+    "completionStatus": "completed",
+    "includeAsset": True,
+    "after": "c1",
+})
+_P_LIST_DRIVERS_FULL = MappingProxyType({
+    "driverActivationStatus": "deactivated",
+    "limit": 50,
+    "after": "c1",
+    "tagIds": "t1,t2",
+    "updatedAfterTime": "2025-01-01T00:00:00Z",
+})
+_P_LIST_GATEWAYS_FULL = MappingProxyType({"models": ["AG24", "AG32"], "after": "cursor-gw"})
+_P_LIST_TAGS_FULL = MappingProxyType({"limit": 10, "after": "cursor-1"})
+_P_GET_SPEEDING_INTERVALS_FULL = MappingProxyType({
+    "assetIds": ["asset-1", "asset-2"],
+    "startTime": "2024-01-15T00:00:00Z",
+    "endTime": "2024-01-16T00:00:00Z",
+    "queryBy": "tripStartTime",
+    "includeAsset": True,
+})
+_P_GET_SPEEDING_INTERVALS_REQUIRED = MappingProxyType({
+    "assetIds": ["asset-1"],
+    "startTime": "2024-01-15T00:00:00Z",
+})
+
+# IDs used by the path-param tests and the request paths they produce
+_VEH_ID = "281474976712793"
+_VEH_PATH = f"/fleet/vehicles/{_VEH_ID}"
+_DRV_ID = "driver-123"
+_DRV_PATH = f"/fleet/drivers/{_DRV_ID}"
+
+
+class FakeResponse:
+    """Stand-in for httpx.Response exposing only what SamsaraClient reads."""
+
+    __slots__ = ("status_code", "headers", "text", "_json")
+
+    def __init__(self, status_code: int, headers: dict, text: str, json_data: dict):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+        self._json = json_data
+
+    def json(self):
+        return self._json
+
 
 def _make_response(status_code: int, json_data: dict | None = None, headers: dict | None = None):
-    """Build a mock httpx Response."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    resp.headers = headers or {}
-    resp.text = ""
-    resp.json = MagicMock(return_value=json_data or {})
-    return resp
+    """Build a fake httpx Response."""
+    return FakeResponse(status_code, headers or {}, "", json_data or {})
+
+
+# Shared responses for the common cases. Tests only read these; one that needs
+# to modify a response builds its own with _make_response().
+_OK = {
+    id(payload): FakeResponse(200, {}, "", payload)
+    for payload in (
+        SAMPLE_VEHICLES_RESPONSE,
+        SAMPLE_CREATE_DRIVER_RESPONSE,
+        SAMPLE_GET_VEHICLE_RESPONSE,
+        SAMPLE_UPDATE_VEHICLE_RESPONSE,
+        SAMPLE_LOCATIONS_RESPONSE,
+        SAMPLE_SAFETY_EVENTS_RESPONSE,
+        SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE,
+        SAMPLE_TRIPS_RESPONSE,
+        SAMPLE_DRIVERS_RESPONSE,
+        SAMPLE_GATEWAYS_RESPONSE,
+        SAMPLE_GET_DRIVER_RESPONSE,
+        SAMPLE_UPDATE_DRIVER_RESPONSE,
+        SAMPLE_LIST_TAGS_RESPONSE,
+        SAMPLE_CREATE_TAG_RESPONSE,
+        SAMPLE_SPEEDING_INTERVALS_RESPONSE,
+        SAMPLE_SAFETY_SETTINGS_RESPONSE,
+        SAMPLE_ORG_INFO_RESPONSE,
+    )
+}
+_UNAUTHORIZED = FakeResponse(401, {}, "", {"message": "Unauthorized"})
+
+
+def _ok(payload: dict) -> FakeResponse:
+    """The shared 200 response for one of the SAMPLE_* payloads."""
+    return _OK[id(payload)]
+
+
+class _StubMethod:
+    """
+    Awaitable stand-in for one AsyncClient method. Returns `return_value` and
+    records calls, keeping the slice of the AsyncMock API these tests use
+    without AsyncMock's per-call bookkeeping.
+    """
+
+    __slots__ = ("return_value", "calls")
+
+    def __init__(self):
+        self.return_value = None
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    @property
+    def call_args(self) -> tuple[tuple, dict]:
+        return self.calls[-1]
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)], f"expected one call {(args, kwargs)}, got {self.calls}"
+
+    def reset(self, return_value=None):
+        self.calls.clear()
+        self.return_value = return_value
+
 
+class StubAsyncClient:
+    """The httpx.AsyncClient surface SamsaraClient uses: get, post, patch."""
 
-@pytest.fixture
+    __slots__ = ("get", "post", "patch")
+
+    def __init__(self):
+        self.get = _StubMethod()
+        self.post = _StubMethod()
+        self.patch = _StubMethod()
+
+
+# The stub and the client wrapping it are built once per module; the autouse
+# fixture below resets the stub before each test instead of rebuilding both.
+@pytest.fixture(scope="module")
 def mock_httpx_client():
-    """Mock AsyncClient; capture get/post calls and return configurable responses."""
-    client = AsyncMock()
-    client.get = AsyncMock(return_value=_make_response(200, SAMPLE_VEHICLES_RESPONSE))
-    client.post = AsyncMock(return_value=_make_response(200, SAMPLE_CREATE_DRIVER_RESPONSE))
-    return client
+    """Stub AsyncClient; capture get/post/patch calls and return configurable responses."""
+    return StubAsyncClient()
 
 
-@pytest.fixture
-def client(mock_httpx_client):
-    """SamsaraClient with mocked httpx.AsyncClient (no real HTTP)."""
+@pytest.fixture(autouse=True)
+def _reset_mock_httpx_client(mock_httpx_client):
+    """Clear recorded calls and restore the default get/post responses."""
+    mock_httpx_client.get.reset(_ok(SAMPLE_VEHICLES_RESPONSE))
+    mock_httpx_client.post.reset(_ok(SAMPLE_CREATE_DRIVER_RESPONSE))
+    mock_httpx_client.patch.reset()
+
+
+# Module- rather than session-scoped so the patch is gone before other test
+# modules run.
+@pytest.fixture(scope="module", autouse=True)
+def _patch_async_client(mock_httpx_client):
+    """Make every httpx.AsyncClient built in this module the stub."""
     with patch("samsara_client.httpx.AsyncClient", return_value=mock_httpx_client):
-        with patch.dict("os.environ", {"SAMSARA_API_TOKEN": "test-token"}, clear=False):
-            yield SamsaraClient(api_token="test-token")
+        yield
+
+
+@pytest.fixture(scope="module")
+def client(_patch_async_client):
+    """SamsaraClient with mocked httpx.AsyncClient (no real HTTP)."""
+    return SamsaraClient(api_token="test-token")
+
+
+# ---------------------------------------------------------------------------
+# Construction — pooled httpx.AsyncClient
+# ---------------------------------------------------------------------------
+
+def test_client_uses_pooled_keepalive_connections():
+    with patch("samsara_client.httpx.AsyncClient") as async_client:
+        SamsaraClient(api_token="test-token")
+    kwargs = async_client.call_args.kwargs
+    assert kwargs["base_url"] == "https://api.samsara.com"
+    assert kwargs["limits"] is DEFAULT_LIMITS
+    assert DEFAULT_LIMITS.max_keepalive_connections > 0
+
+
+def test_client_enables_http2_only_when_h2_is_installed():
+    with patch("samsara_client.httpx.AsyncClient") as async_client:
+        SamsaraClient(api_token="test-token")
+    assert async_client.call_args.kwargs["http2"] is HTTP2_AVAILABLE
+
+    with patch("samsara_client.httpx.AsyncClient") as async_client:
+        SamsaraClient(api_token="test-token", http2=False)
+    assert async_client.call_args.kwargs["http2"] is False
 
 
 # ---------------------------------------------------------------------------
@@ -67,7 +270,7 @@ def client(mock_httpx_client):
 # ---------------------------------------------------------------------------
 
 async def test_list_vehicles_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_VEHICLES_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_VEHICLES_RESPONSE)
     await client.list_vehicles(
         limit=10,
         after="cursor-1",
@@ -80,24 +283,15 @@ async def test_list_vehicles_builds_correct_params(client, mock_httpx_client):
     )
     mock_httpx_client.get.assert_called_once_with(
         "/fleet/vehicles",
-        params={
-            "limit": 10,
-            "after": "cursor-1",
-            "parentTagIds": "1,2",
-            "tagIds": "3,4",
-            "attributeValueIds": "uuid-a",
-            "attributes": ["attr:value"],
-            "updatedAfterTime": "2025-01-01T00:00:00Z",
-            "createdAfterTime": "2025-01-02T00:00:00Z",
-        },
+        params=_P_LIST_VEHICLES_FULL,
     )
 
 
 async def test_list_vehicles_default_values_empty_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_VEHICLES_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_VEHICLES_RESPONSE)
     result = await client.list_vehicles()
     assert result == SAMPLE_VEHICLES_RESPONSE
-    mock_httpx_client.get.assert_called_once_with("/fleet/vehicles", params={})
+    mock_httpx_client.get.assert_called_once_with("/fleet/vehicles", params=_P_EMPTY)
 
 
 # ---------------------------------------------------------------------------
@@ -105,49 +299,35 @@ async def test_list_vehicles_default_values_empty_params(client, mock_httpx_clie
 # ---------------------------------------------------------------------------
 
 async def test_get_vehicle_builds_correct_request(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_GET_VEHICLE_RESPONSE)
-    await client.get_vehicle(id="281474976712793")
+    mock_httpx_client.get.return_value = _ok(SAMPLE_GET_VEHICLE_RESPONSE)
+    await client.get_vehicle(id=_VEH_ID)
     mock_httpx_client.get.assert_called_once_with(
-        "/fleet/vehicles/281474976712793",
-        params={},
+        _VEH_PATH,
+        params=_P_EMPTY,
     )
 
 
-async def test_get_vehicle_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_vehicle(id="281474976712793")
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # update_vehicle — PATCH path + body
 # ---------------------------------------------------------------------------
 
 async def test_update_vehicle_sends_correct_request(client, mock_httpx_client):
-    mock_httpx_client.patch.return_value = _make_response(200, SAMPLE_UPDATE_VEHICLE_RESPONSE)
+    mock_httpx_client.patch.return_value = _ok(SAMPLE_UPDATE_VEHICLE_RESPONSE)
     body = {"name": "Truck 1 Updated"}
-    result = await client.update_vehicle(id="281474976712793", vehicle=body)
+    result = await client.update_vehicle(id=_VEH_ID, vehicle=body)
     assert result == SAMPLE_UPDATE_VEHICLE_RESPONSE
     mock_httpx_client.patch.assert_called_once_with(
-        "/fleet/vehicles/281474976712793",
+        _VEH_PATH,
         json=body,
     )
 
 
-async def test_update_vehicle_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.patch.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.update_vehicle(id="281474976712793", vehicle={})
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # get_asset_locations — query params and defaults
 # ---------------------------------------------------------------------------
 
 async def test_get_asset_locations_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_LOCATIONS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_LOCATIONS_RESPONSE)
     await client.get_asset_locations(
         after="c1",
         limit=100,
@@ -159,20 +339,12 @@ async def test_get_asset_locations_builds_correct_params(client, mock_httpx_clie
     )
     mock_httpx_client.get.assert_called_once_with(
         "/assets/location-and-speed/stream",
-        params={
-            "after": "c1",
-            "limit": 100,
-            "startTime": "2025-01-01T00:00:00Z",
-            "endTime": "2025-01-01T23:59:59Z",
-            "ids": "id1,id2",
-            "includeSpeed": True,
-            "includeReverseGeo": True,
-        },
+        params=_P_GET_ASSET_LOCATIONS_FULL,
     )
 
 
 async def test_get_asset_locations_default_values(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_LOCATIONS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_LOCATIONS_RESPONSE)
     result = await client.get_asset_locations(start_time="2025-01-01T00:00:00Z")
     assert result == SAMPLE_LOCATIONS_RESPONSE
     call_params = mock_httpx_client.get.call_args[1]["params"]
@@ -186,7 +358,7 @@ async def test_get_asset_locations_default_values(client, mock_httpx_client):
 # ---------------------------------------------------------------------------
 
 async def test_get_safety_events_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SAFETY_EVENTS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SAFETY_EVENTS_RESPONSE)
     await client.get_safety_events(
         start_time="2025-01-01T00:00:00Z",
         end_time="2025-01-07T00:00:00Z",
@@ -202,24 +374,12 @@ async def test_get_safety_events_builds_correct_params(client, mock_httpx_client
     )
     mock_httpx_client.get.assert_called_once_with(
         "/safety-events/stream",
-        params={
-            "startTime": "2025-01-01T00:00:00Z",
-            "endTime": "2025-01-07T00:00:00Z",
-            "queryByTimeField": "createdAtTime",
-            "assetIds": "a1",
-            "driverIds": "d1",
-            "tagIds": "t1",
-            "behaviorLabels": "HarshBraking",
-            "eventStates": "needsReview",
-            "includeAsset": True,
-            "includeDriver": True,
-            "after": "cursor",
-        },
+        params=_P_GET_SAFETY_EVENTS_FULL,
     )
 
 
 async def test_get_safety_events_required_start_time_in_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SAFETY_EVENTS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SAFETY_EVENTS_RESPONSE)
     await client.get_safety_events(start_time="2025-01-01T00:00:00Z")
     call_params = mock_httpx_client.get.call_args[1]["params"]
     assert call_params["startTime"] == "2025-01-01T00:00:00Z"
@@ -230,7 +390,7 @@ async def test_get_safety_events_required_start_time_in_params(client, mock_http
 # ---------------------------------------------------------------------------
 
 async def test_get_safety_events_by_id_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE)
     await client.get_safety_events_by_id(
         safety_event_ids=["evt-uuid-1", "evt-uuid-2"],
         include_asset=True,
@@ -239,38 +399,26 @@ async def test_get_safety_events_by_id_builds_correct_params(client, mock_httpx_
     )
     mock_httpx_client.get.assert_called_once_with(
         "/safety-events",
-        params={
-            "safetyEventIds": ["evt-uuid-1", "evt-uuid-2"],
-            "includeAsset": True,
-            "includeDriver": True,
-            "after": "cursor-1",
-        },
+        params=_P_GET_SAFETY_EVENTS_BY_ID_FULL,
     )
 
 
 async def test_get_safety_events_by_id_only_required(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE)
     result = await client.get_safety_events_by_id(safety_event_ids=["evt-1"])
     assert result == SAMPLE_SAFETY_EVENTS_BY_ID_RESPONSE
     mock_httpx_client.get.assert_called_once_with(
         "/safety-events",
-        params={"safetyEventIds": ["evt-1"]},
+        params=_P_GET_SAFETY_EVENTS_BY_ID_REQUIRED,
     )
 
 
-async def test_get_safety_events_by_id_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_safety_events_by_id(safety_event_ids=["evt-1"])
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # get_trips — query params and defaults
 # ---------------------------------------------------------------------------
 
 async def test_get_trips_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_TRIPS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_TRIPS_RESPONSE)
     await client.get_trips(
         ids="id1,id2",
         start_time="2025-01-01T00:00:00Z",
@@ -282,20 +430,12 @@ async def test_get_trips_builds_correct_params(client, mock_httpx_client):
     )
     mock_httpx_client.get.assert_called_once_with(
         "/trips/stream",
-        params={
-            "ids": "id1,id2",
-            "startTime": "2025-01-01T00:00:00Z",
-            "endTime": "2025-01-07T00:00:00Z",
-            "queryBy": "tripStartTime",
-            "completionStatus": "completed",
-            "includeAsset": True,
-            "after": "c1",
-        },
+        params=_P_GET_TRIPS_FULL,
     )
 
 
 async def test_get_trips_required_ids_and_start_time(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_TRIPS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_TRIPS_RESPONSE)
     await client.get_trips(ids="v1", start_time="2025-01-01T00:00:00Z")
     call_params = mock_httpx_client.get.call_args[1]["params"]
     assert call_params["ids"] == "v1"
@@ -307,7 +447,7 @@ async def test_get_trips_required_ids_and_start_time(client, mock_httpx_client):
 # ---------------------------------------------------------------------------
 
 async def test_list_drivers_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_DRIVERS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_DRIVERS_RESPONSE)
     await client.list_drivers(
         driver_activation_status="deactivated",
         limit=50,
@@ -317,21 +457,15 @@ async def test_list_drivers_builds_correct_params(client, mock_httpx_client):
     )
     mock_httpx_client.get.assert_called_once_with(
         "/fleet/drivers",
-        params={
-            "driverActivationStatus": "deactivated",
-            "limit": 50,
-            "after": "c1",
-            "tagIds": "t1,t2",
-            "updatedAfterTime": "2025-01-01T00:00:00Z",
-        },
+        params=_P_LIST_DRIVERS_FULL,
     )
 
 
 async def test_list_drivers_default_empty_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_DRIVERS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_DRIVERS_RESPONSE)
     result = await client.list_drivers()
     assert result == SAMPLE_DRIVERS_RESPONSE
-    mock_httpx_client.get.assert_called_once_with("/fleet/drivers", params={})
+    mock_httpx_client.get.assert_called_once_with("/fleet/drivers", params=_P_EMPTY)
 
 
 # ---------------------------------------------------------------------------
@@ -339,26 +473,19 @@ async def test_list_drivers_default_empty_params(client, mock_httpx_client):
 # ---------------------------------------------------------------------------
 
 async def test_list_gateways_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_GATEWAYS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_GATEWAYS_RESPONSE)
     await client.list_gateways(models=["AG24", "AG32"], after="cursor-gw")
     mock_httpx_client.get.assert_called_once_with(
         "/gateways",
-        params={"models": ["AG24", "AG32"], "after": "cursor-gw"},
+        params=_P_LIST_GATEWAYS_FULL,
     )
 
 
 async def test_list_gateways_default_values(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_GATEWAYS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_GATEWAYS_RESPONSE)
     result = await client.list_gateways()
     assert result == SAMPLE_GATEWAYS_RESPONSE
-    mock_httpx_client.get.assert_called_once_with("/gateways", params={})
-
-
-async def test_list_gateways_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.list_gateways()
-    assert exc_info.value.status_code == 401
+    mock_httpx_client.get.assert_called_once_with("/gateways", params=_P_EMPTY)
 
 
 # ---------------------------------------------------------------------------
@@ -366,7 +493,7 @@ async def test_list_gateways_401_raises_samsara_api_error(client, mock_httpx_cli
 # ---------------------------------------------------------------------------
 
 async def test_create_driver_sends_correct_body(client, mock_httpx_client):
-    mock_httpx_client.post.return_value = _make_response(200, SAMPLE_CREATE_DRIVER_RESPONSE)
+    mock_httpx_client.post.return_value = _ok(SAMPLE_CREATE_DRIVER_RESPONSE)
     body = {"name": "Jane Doe", "username": "janedoe", "password": "secret123"}
     result = await client.create_driver(body)
     assert result == SAMPLE_CREATE_DRIVER_RESPONSE
@@ -378,68 +505,47 @@ async def test_create_driver_sends_correct_body(client, mock_httpx_client):
 # ---------------------------------------------------------------------------
 
 async def test_get_driver_builds_correct_request(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_GET_DRIVER_RESPONSE)
-    await client.get_driver(id="driver-123")
+    mock_httpx_client.get.return_value = _ok(SAMPLE_GET_DRIVER_RESPONSE)
+    await client.get_driver(id=_DRV_ID)
     mock_httpx_client.get.assert_called_once_with(
-        "/fleet/drivers/driver-123",
-        params={},
+        _DRV_PATH,
+        params=_P_EMPTY,
     )
 
 
-async def test_get_driver_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_driver(id="driver-123")
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # update_driver — PATCH path + body
 # ---------------------------------------------------------------------------
 
 async def test_update_driver_sends_correct_request(client, mock_httpx_client):
-    mock_httpx_client.patch.return_value = _make_response(200, SAMPLE_UPDATE_DRIVER_RESPONSE)
+    mock_httpx_client.patch.return_value = _ok(SAMPLE_UPDATE_DRIVER_RESPONSE)
     body = {"name": "Jane Doe Updated", "driverActivationStatus": "active"}
-    result = await client.update_driver(id="driver-123", driver=body)
+    result = await client.update_driver(id=_DRV_ID, driver=body)
     assert result == SAMPLE_UPDATE_DRIVER_RESPONSE
     mock_httpx_client.patch.assert_called_once_with(
-        "/fleet/drivers/driver-123",
+        _DRV_PATH,
         json=body,
     )
 
 
-async def test_update_driver_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.patch.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.update_driver(id="driver-123", driver={})
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # list_tags — query params and defaults
 # ---------------------------------------------------------------------------
 
 async def test_list_tags_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_LIST_TAGS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_LIST_TAGS_RESPONSE)
     await client.list_tags(limit=10, after="cursor-1")
     mock_httpx_client.get.assert_called_once_with(
         "/tags",
-        params={"limit": 10, "after": "cursor-1"},
+        params=_P_LIST_TAGS_FULL,
     )
 
 
 async def test_list_tags_default_values(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_LIST_TAGS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_LIST_TAGS_RESPONSE)
     result = await client.list_tags()
     assert result == SAMPLE_LIST_TAGS_RESPONSE
-    mock_httpx_client.get.assert_called_once_with("/tags", params={})
-
-
-async def test_list_tags_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.list_tags()
-    assert exc_info.value.status_code == 401
+    mock_httpx_client.get.assert_called_once_with("/tags", params=_P_EMPTY)
 
 
 # ---------------------------------------------------------------------------
@@ -447,30 +553,19 @@ async def test_list_tags_401_raises_samsara_api_error(client, mock_httpx_client)
 # ---------------------------------------------------------------------------
 
 async def test_create_tag_sends_correct_body(client, mock_httpx_client):
-    mock_httpx_client.post.return_value = _make_response(200, SAMPLE_CREATE_TAG_RESPONSE)
+    mock_httpx_client.post.return_value = _ok(SAMPLE_CREATE_TAG_RESPONSE)
     body = {"name": "New Tag"}
     result = await client.create_tag(body)
     assert result == SAMPLE_CREATE_TAG_RESPONSE
     mock_httpx_client.post.assert_called_once_with("/tags", json=body)
 
 
-async def test_create_tag_429_raises_rate_limit_error(client, mock_httpx_client):
-    mock_httpx_client.post.return_value = _make_response(
-        429,
-        {"message": "Too many requests"},
-        headers={"Retry-After": "30"},
-    )
-    with pytest.raises(SamsaraRateLimitError) as exc_info:
-        await client.create_tag({"name": "Test"})
-    assert exc_info.value.retry_after == 30
-
-
 # ---------------------------------------------------------------------------
 # get_speeding_intervals — GET /speeding-intervals/stream
 # ---------------------------------------------------------------------------
 
 async def test_get_speeding_intervals_builds_correct_params(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SPEEDING_INTERVALS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SPEEDING_INTERVALS_RESPONSE)
     await client.get_speeding_intervals(
         asset_ids=["asset-1", "asset-2"],
         start_time="2024-01-15T00:00:00Z",
@@ -480,18 +575,12 @@ async def test_get_speeding_intervals_builds_correct_params(client, mock_httpx_c
     )
     mock_httpx_client.get.assert_called_once_with(
         "/speeding-intervals/stream",
-        params={
-            "assetIds": ["asset-1", "asset-2"],
-            "startTime": "2024-01-15T00:00:00Z",
-            "endTime": "2024-01-16T00:00:00Z",
-            "queryBy": "tripStartTime",
-            "includeAsset": True,
-        },
+        params=_P_GET_SPEEDING_INTERVALS_FULL,
     )
 
 
 async def test_get_speeding_intervals_required_only(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SPEEDING_INTERVALS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SPEEDING_INTERVALS_RESPONSE)
     result = await client.get_speeding_intervals(
         asset_ids=["asset-1"],
         start_time="2024-01-15T00:00:00Z",
@@ -499,59 +588,32 @@ async def test_get_speeding_intervals_required_only(client, mock_httpx_client):
     assert result == SAMPLE_SPEEDING_INTERVALS_RESPONSE
     mock_httpx_client.get.assert_called_once_with(
         "/speeding-intervals/stream",
-        params={
-            "assetIds": ["asset-1"],
-            "startTime": "2024-01-15T00:00:00Z",
-        },
+        params=_P_GET_SPEEDING_INTERVALS_REQUIRED,
     )
 
 
-async def test_get_speeding_intervals_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_speeding_intervals(
-            asset_ids=["asset-1"],
-            start_time="2024-01-15T00:00:00Z",
-        )
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # get_safety_settings — GET /fleet/settings/safety, no params
 # ---------------------------------------------------------------------------
 
 async def test_get_safety_settings_calls_endpoint(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_SAFETY_SETTINGS_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_SAFETY_SETTINGS_RESPONSE)
     result = await client.get_safety_settings()
     assert result == SAMPLE_SAFETY_SETTINGS_RESPONSE
     mock_httpx_client.get.assert_called_once_with("/fleet/settings/safety")
 
 
-async def test_get_safety_settings_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_safety_settings()
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # get_organization_info — GET /me, no params
 # ---------------------------------------------------------------------------
 
 async def test_get_organization_info_calls_me_endpoint(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(200, SAMPLE_ORG_INFO_RESPONSE)
+    mock_httpx_client.get.return_value = _ok(SAMPLE_ORG_INFO_RESPONSE)
     result = await client.get_organization_info()
     assert result == SAMPLE_ORG_INFO_RESPONSE
     mock_httpx_client.get.assert_called_once_with("/me")
 
 
-async def test_get_organization_info_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_organization_info()
-    assert exc_info.value.status_code == 401
-
-
 # ---------------------------------------------------------------------------
 # Error handling: 401, 429, 500
 # ---------------------------------------------------------------------------
@@ -568,15 +630,64 @@ async def test_list_vehicles_401_raises_samsara_api_error(client, mock_httpx_cli
     assert "token" in msg.lower() or "401" in msg
 
 
-async def test_list_vehicles_429_raises_rate_limit_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(
+@pytest.mark.parametrize(
+    "method, call",
+    [
+        ("get", lambda c: c.get_vehicle(id=_VEH_ID)),
+        ("patch", lambda c: c.update_vehicle(id=_VEH_ID, vehicle={})),
+        ("get", lambda c: c.get_asset_locations(start_time="2025-01-01T00:00:00Z")),
+        ("get", lambda c: c.get_safety_events_by_id(safety_event_ids=["evt-1"])),
+        ("get", lambda c: c.list_gateways()),
+        ("get", lambda c: c.get_driver(id=_DRV_ID)),
+        ("patch", lambda c: c.update_driver(id=_DRV_ID, driver={})),
+        ("get", lambda c: c.list_tags()),
+        ("get", lambda c: c.get_speeding_intervals(
+            asset_ids=["asset-1"], start_time="2024-01-15T00:00:00Z",
+        )),
+        ("get", lambda c: c.get_safety_settings()),
+        ("get", lambda c: c.get_organization_info()),
+    ],
+    ids=[
+        "get_vehicle", "update_vehicle", "get_asset_locations", "get_safety_events_by_id",
+        "list_gateways", "get_driver", "update_driver", "list_tags",
+        "get_speeding_intervals", "get_safety_settings", "get_organization_info",
+    ],
+)
+async def test_401_raises_samsara_api_error(client, mock_httpx_client, method, call):
+    getattr(mock_httpx_client, method).return_value = _UNAUTHORIZED
+    with pytest.raises(SamsaraAPIError) as exc_info:
+        await call(client)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "method, call, retry_after",
+    [
+        ("get", lambda c: c.list_vehicles(), 60),
+        ("post", lambda c: c.create_driver({"name": "A", "username": "a", "password": "p"}), 30),
+        ("post", lambda c: c.create_tag({"name": "Test"}), 30),
+    ],
+    ids=["list_vehicles", "create_driver", "create_tag"],
+)
+async def test_429_raises_rate_limit_error(client, mock_httpx_client, method, call, retry_after):
+    getattr(mock_httpx_client, method).return_value = _make_response(
         429,
-        {"message": "Rate limit exceeded"},
-        headers={"Retry-After": "60"},
+        {"message": "Too many requests"},
+        headers={"Retry-After": str(retry_after)},
     )
     with pytest.raises(SamsaraRateLimitError) as exc_info:
+        await call(client)
+    assert exc_info.value.retry_after == retry_after
+
+
+async def test_api_error_keeps_raw_response_text(client, mock_httpx_client):
+    response = _make_response(400, {"message": "Bad request"})
+    response.text = '{"message":"Bad request"}'
+    mock_httpx_client.get.return_value = response
+    with pytest.raises(SamsaraAPIError) as exc_info:
         await client.list_vehicles()
-    assert exc_info.value.retry_after == 60
+    assert exc_info.value.response_body == {"message": "Bad request"}
+    assert exc_info.value.response_text == '{"message":"Bad request"}'
 
 
 async def test_list_vehicles_500_raises_samsara_api_error(client, mock_httpx_client):
@@ -587,21 +698,3 @@ async def test_list_vehicles_500_raises_samsara_api_error(client, mock_httpx_cli
     with pytest.raises(SamsaraAPIError) as exc_info:
         await client.list_vehicles()
     assert exc_info.value.status_code == 500
-
-
-async def test_create_driver_429_raises_rate_limit_error(client, mock_httpx_client):
-    mock_httpx_client.post.return_value = _make_response(
-        429,
-        {"message": "Too many requests"},
-        headers={"Retry-After": "30"},
-    )
-    with pytest.raises(SamsaraRateLimitError) as exc_info:
-        await client.create_driver({"name": "A", "username": "a", "password": "p"})
-    assert exc_info.value.retry_after == 30
-
-
-async def test_get_asset_locations_401_raises_samsara_api_error(client, mock_httpx_client):
-    mock_httpx_client.get.return_value = _make_response(401, {"message": "Unauthorized"})
-    with pytest.raises(SamsaraAPIError) as exc_info:
-        await client.get_asset_locations(start_time="2025-01-01T00:00:00Z")
-    assert exc_info.value.status_code == 401
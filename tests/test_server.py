@@ -5,14 +5,20 @@ Verifies all tools are registered, have inputSchema properties, and descriptions
 Does not make real API calls; call_tool is not exercised against live API.
 """
 
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 # Import list_tools from server (the registered handler returns the tool list)
-from server import list_tools
+import server
+from samsara_client import SamsaraAPIError, SamsaraError, SamsaraRateLimitError
+from server import list_tools, TOOL_HANDLERS, _VALIDATORS, _RateLimiter
 
 
 # Expected tools
-EXPECTED_TOOL_NAMES = [
+EXPECTED_TOOL_NAMES = (
     "list_vehicles",
     "get_vehicle",
     "update_vehicle",
@@ -30,240 +36,686 @@ EXPECTED_TOOL_NAMES = [
     "get_speeding_intervals",
     "get_safety_settings",
     "get_org_info",
-]
+)
+_EXPECTED_SET = frozenset(EXPECTED_TOOL_NAMES)
 
 # Tools that have required fields in inputSchema
 TOOLS_WITH_REQUIRED = {
-    "get_trips": ["ids"],
-    "get_safety_events_by_id": ["safetyEventIds"],
-    "create_driver": ["name", "username", "password"],
-    "get_driver": ["id"],
-    "update_driver": ["id", "body"],
-    "get_vehicle": ["id"],
-    "update_vehicle": ["id", "body"],
+    "get_trips": ("ids",),
+    "get_safety_events_by_id": ("safetyEventIds",),
+    "create_driver": ("name", "username", "password"),
+    "get_driver": ("id",),
+    "update_driver": ("id", "body"),
+    "get_vehicle": ("id",),
+    "update_vehicle": ("id", "body"),
 }
 
 
-@pytest.fixture
-async def tools():
+def pytest_generate_tests(metafunc):
+    """Run tests taking a `tool` argument once per registered tool, with the tool name as id."""
+    if "tool" in metafunc.fixturenames:
+        registered = asyncio.run(list_tools())
+        metafunc.parametrize("tool", registered, ids=[t.name for t in registered])
+
+
+# Tool definitions are static, so list_tools() runs once for the whole session.
+# A plain fixture resolving the coroutine itself lets the tests that only read
+# tool definitions be ordinary functions rather than asyncio-driven ones.
+@pytest.fixture(scope="session")
+def tools():
     """Fetch the list of tools from the MCP server (no HTTP, just the registered list)."""
-    return await list_tools()
+    return asyncio.run(list_tools())
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(tools):
+    """The registered tools keyed by name."""
+    return {t.name: t for t in tools}
+
+
+@pytest.fixture(scope="session")
+def required_by_name(tools):
+    """Each tool's inputSchema required list as a tuple (order kept), keyed by name."""
+    return {t.name: tuple(t.inputSchema.get("required", ())) for t in tools}
+
+
+@pytest.fixture(scope="session")
+def required_set_by_name(required_by_name):
+    """Each tool's required arguments as a frozenset, for order-insensitive checks."""
+    return {name: frozenset(required) for name, required in required_by_name.items()}
+
+
+@pytest.fixture(scope="session")
+def tool_names(tools):
+    """Names of the registered tools."""
+    return frozenset(t.name for t in tools)
+
+
+@pytest.fixture(scope="session")
+def descriptions_lower(tools):
+    """Each tool's description, lowercased once, keyed by tool name."""
+    return {t.name: (t.description or "").lower() for t in tools}
 
 
 # ---------------------------------------------------------------------------
 # All tools registered
 # ---------------------------------------------------------------------------
 
-async def test_all_tools_are_registered(tools):
+def test_all_tools_are_registered(tool_names):
     """All expected tools appear in list_tools()."""
-    names = [t.name for t in tools]
-    for expected in EXPECTED_TOOL_NAMES:
-        assert expected in names, f"Tool {expected!r} not registered. Got: {names}"
+    missing = _EXPECTED_SET - tool_names
+    assert not missing, f"Tools not registered: {sorted(missing)}"
 
 
-async def test_tool_count(tools):
-    """Exactly the expected number of tools."""
-    assert len(tools) == len(EXPECTED_TOOL_NAMES)
+def test_tool_count(tools):
+    """Exactly the expected number of tools (counted from the list, so duplicates fail)."""
+    assert len(tools) == len(_EXPECTED_SET)
 
 
 # ---------------------------------------------------------------------------
-# inputSchema: type object and properties
+# Per tool: inputSchema (type object and properties) and description
 # ---------------------------------------------------------------------------
 
-async def test_each_tool_has_input_schema(tools):
-    """Every tool has an inputSchema with type and properties."""
-    for tool in tools:
-        assert hasattr(tool, "inputSchema"), f"{tool.name} missing inputSchema"
-        schema = tool.inputSchema
-        assert isinstance(schema, dict), f"{tool.name} inputSchema not a dict"
-        assert schema.get("type") == "object", f"{tool.name} inputSchema.type should be 'object'"
-        assert "properties" in schema, f"{tool.name} inputSchema missing 'properties'"
-        assert isinstance(schema["properties"], dict), f"{tool.name} inputSchema.properties not a dict"
-
-
-async def test_tools_with_required_have_required_key(tools):
-    """Tools that require parameters have inputSchema.required and correct keys."""
-    by_name = {t.name: t for t in tools}
-    for tool_name, required_list in TOOLS_WITH_REQUIRED.items():
-        assert tool_name in by_name, f"Tool {tool_name} not in tools"
-        schema = by_name[tool_name].inputSchema
-        assert "required" in schema, f"{tool_name} should have inputSchema.required"
-        assert schema["required"] == required_list, (
-            f"{tool_name} required should be {required_list}, got {schema.get('required')}"
-        )
-
-
-async def test_list_vehicles_schema_properties(tools):
-    """list_vehicles has expected inputSchema properties."""
-    tool = next(t for t in tools if t.name == "list_vehicles")
-    props = tool.inputSchema["properties"]
-    expected = {"limit", "after", "parentTagIds", "tagIds", "attributeValueIds", "attributes", "updatedAfterTime", "createdAfterTime"}
-    assert expected.issubset(props.keys()), f"list_vehicles missing properties: {expected - props.keys()}"
-
-
-async def test_get_vehicle_schema_properties_and_required(tools):
-    """get_vehicle has inputSchema with id property and required id."""
-    tool = next(t for t in tools if t.name == "get_vehicle")
-    props = tool.inputSchema["properties"]
-    assert "id" in props, "get_vehicle missing 'id' property"
-    assert tool.inputSchema.get("required") == ["id"]
-
-
-async def test_update_vehicle_schema_properties_and_required(tools):
-    """update_vehicle has inputSchema with id, body and required id, body."""
-    tool = next(t for t in tools if t.name == "update_vehicle")
-    props = tool.inputSchema["properties"]
-    assert "id" in props and "body" in props, "update_vehicle missing 'id' or 'body' property"
-    assert set(tool.inputSchema.get("required", [])) == {"id", "body"}
-
-
-async def test_get_asset_locations_schema_properties(tools):
-    """get_asset_locations has expected inputSchema properties."""
-    tool = next(t for t in tools if t.name == "get_asset_locations")
-    props = tool.inputSchema["properties"]
-    expected = {"after", "limit", "startTime", "endTime", "ids", "includeSpeed", "includeReverseGeo"}
-    assert expected.issubset(props.keys()), f"get_asset_locations missing properties: {expected - props.keys()}"
-
-
-async def test_get_safety_events_schema_properties(tools):
-    """get_safety_events has expected inputSchema properties."""
-    tool = next(t for t in tools if t.name == "get_safety_events")
-    props = tool.inputSchema["properties"]
-    expected = {"startTime", "endTime", "queryByTimeField", "assetIds", "driverIds", "tagIds", "behaviorLabels", "eventStates", "includeAsset", "includeDriver", "after"}
-    assert expected.issubset(props.keys()), f"get_safety_events missing properties: {expected - props.keys()}"
-
-
-async def test_get_safety_events_by_id_schema_properties(tools):
-    """get_safety_events_by_id has expected inputSchema properties and required safetyEventIds."""
-    tool = next(t for t in tools if t.name == "get_safety_events_by_id")
-    props = tool.inputSchema["properties"]
-    expected = {"safetyEventIds", "includeAsset", "includeDriver", "includeVgOnlyEvents", "after"}
-    assert expected.issubset(props.keys()), f"get_safety_events_by_id missing properties: {expected - props.keys()}"
-    assert tool.inputSchema["required"] == ["safetyEventIds"]
-
-
-async def test_get_trips_schema_properties(tools):
-    """get_trips has expected inputSchema properties and required ids."""
-    tool = next(t for t in tools if t.name == "get_trips")
-    props = tool.inputSchema["properties"]
-    expected = {"ids", "startTime", "endTime", "queryBy", "completionStatus", "includeAsset", "after"}
-    assert expected.issubset(props.keys()), f"get_trips missing properties: {expected - props.keys()}"
-    assert tool.inputSchema["required"] == ["ids"]
-
-
-async def test_get_drivers_schema_properties(tools):
-    """get_drivers has expected inputSchema properties."""
-    tool = next(t for t in tools if t.name == "get_drivers")
-    props = tool.inputSchema["properties"]
-    expected = {"driverActivationStatus", "limit", "after", "tagIds", "updatedAfterTime", "createdAfterTime"}
-    assert expected.issubset(props.keys()), f"get_drivers missing properties: {expected - props.keys()}"
-
-
-async def test_list_gateways_schema_properties(tools):
-    """list_gateways has expected inputSchema properties."""
-    tool = next(t for t in tools if t.name == "list_gateways")
-    props = tool.inputSchema["properties"]
-    expected = {"models", "after"}
-    assert expected.issubset(props.keys()), f"list_gateways missing properties: {expected - props.keys()}"
-
-
-async def test_create_driver_schema_properties_and_required(tools):
-    """create_driver has expected inputSchema properties and required name, username, password."""
-    tool = next(t for t in tools if t.name == "create_driver")
-    props = tool.inputSchema["properties"]
-    expected = {"name", "username", "password", "licenseNumber", "licenseState", "phone", "notes", "tagIds", "timezone"}
-    assert expected.issubset(props.keys()), f"create_driver missing properties: {expected - props.keys()}"
-    assert set(tool.inputSchema["required"]) == {"name", "username", "password"}
-
-
-async def test_get_driver_schema_properties_and_required(tools):
-    """get_driver has inputSchema with id property and required id."""
-    tool = next(t for t in tools if t.name == "get_driver")
-    props = tool.inputSchema["properties"]
-    assert "id" in props, "get_driver missing 'id' property"
-    assert tool.inputSchema.get("required") == ["id"]
-
-
-async def test_update_driver_schema_properties_and_required(tools):
-    """update_driver has inputSchema with id, body and required id, body."""
-    tool = next(t for t in tools if t.name == "update_driver")
-    props = tool.inputSchema["properties"]
-    assert "id" in props and "body" in props, "update_driver missing 'id' or 'body' property"
-    assert set(tool.inputSchema.get("required", [])) == {"id", "body"}
+def test_tool_is_well_formed(tool):
+    """The tool has an object inputSchema with properties and a non-empty description."""
+    schema = getattr(tool, "inputSchema", None)
+    assert isinstance(schema, dict), f"{tool.name} inputSchema missing or not a dict"
+    assert schema.get("type") == "object", f"{tool.name} inputSchema.type should be 'object'"
+    assert isinstance(schema.get("properties"), dict), f"{tool.name} inputSchema.properties missing or not a dict"
+    description = getattr(tool, "description", None)
+    assert description and description.strip(), f"{tool.name} has empty description"
+
+
+def test_tools_with_required_have_required_key(required_by_name):
+    """Tools that require parameters list them in inputSchema.required, in order."""
+    for tool_name, expected in TOOLS_WITH_REQUIRED.items():
+        assert tool_name in required_by_name, f"Tool {tool_name} not in tools"
+        required = required_by_name[tool_name]
+        assert required == expected, f"{tool_name} required should be {expected}, got {required}"
+
+
+# Per-tool schema expectations: properties that must be present, and the exact
+# required set (None where the tool has no required-set check)
+SCHEMA_EXPECTATIONS = [
+    ("list_vehicles", frozenset({"limit", "after", "parentTagIds", "tagIds", "attributeValueIds", "attributes", "updatedAfterTime", "createdAfterTime"}), None),
+    ("get_vehicle", frozenset({"id"}), frozenset({"id"})),
+    ("update_vehicle", frozenset({"id", "body"}), frozenset({"id", "body"})),
+    ("get_asset_locations", frozenset({"after", "limit", "startTime", "endTime", "ids", "includeSpeed", "includeReverseGeo"}), None),
+    ("get_safety_events", frozenset({"startTime", "endTime", "queryByTimeField", "assetIds", "driverIds", "tagIds", "behaviorLabels", "eventStates", "includeAsset", "includeDriver", "after"}), None),
+    ("get_safety_events_by_id", frozenset({"safetyEventIds", "includeAsset", "includeDriver", "includeVgOnlyEvents", "after"}), frozenset({"safetyEventIds"})),
+    ("get_trips", frozenset({"ids", "startTime", "endTime", "queryBy", "completionStatus", "includeAsset", "after"}), frozenset({"ids"})),
+    ("get_drivers", frozenset({"driverActivationStatus", "limit", "after", "tagIds", "updatedAfterTime", "createdAfterTime"}), None),
+    ("list_gateways", frozenset({"models", "after"}), None),
+    ("create_driver", frozenset({"name", "username", "password", "licenseNumber", "licenseState", "phone", "notes", "tagIds", "timezone"}), frozenset({"name", "username", "password"})),
+    ("get_driver", frozenset({"id"}), frozenset({"id"})),
+    ("update_driver", frozenset({"id", "body"}), frozenset({"id", "body"})),
+    ("list_tags", frozenset({"limit", "after"}), None),
+    ("create_tag", frozenset({"name"}), frozenset({"name"})),
+    ("get_speeding_intervals", frozenset({"assetIds", "startTime", "endTime", "queryBy", "includeAsset", "includeDriverId", "after", "severityLevels"}), frozenset({"assetIds", "startTime"})),
+]
 
 
-async def test_list_tags_schema_properties(tools):
-    """list_tags has expected inputSchema properties."""
-    tool = next(t for t in tools if t.name == "list_tags")
-    props = tool.inputSchema["properties"]
-    expected = {"limit", "after"}
-    assert expected.issubset(props.keys()), f"list_tags missing properties: {expected - props.keys()}"
+@pytest.mark.parametrize(
+    "name, expected_props, expected_required",
+    SCHEMA_EXPECTATIONS,
+    ids=[name for name, _, _ in SCHEMA_EXPECTATIONS],
+)
+def test_schema_properties_and_required(
+    tools_by_name, required_set_by_name, name, expected_props, expected_required
+):
+    """Each tool's inputSchema has its expected properties and required set."""
+    props = tools_by_name[name].inputSchema["properties"]
+    assert props.keys() >= expected_props, f"{name} missing properties: {expected_props - props.keys()}"
+    if expected_required is not None:
+        assert required_set_by_name[name] == expected_required
 
 
-async def test_create_tag_schema_properties_and_required(tools):
-    """create_tag has inputSchema with name required."""
-    tool = next(t for t in tools if t.name == "create_tag")
-    props = tool.inputSchema["properties"]
-    assert "name" in props, "create_tag missing 'name' property"
-    assert tool.inputSchema.get("required") == ["name"]
+def test_get_safety_settings_schema_properties(tools_by_name):
+    """get_safety_settings has inputSchema with type object; no required params."""
+    schema = tools_by_name["get_safety_settings"].inputSchema
+    assert schema.get("type") == "object"
+    assert "properties" in schema
+    assert schema["properties"] == {}
 
 
-async def test_get_speeding_intervals_schema_properties_and_required(tools):
-    """get_speeding_intervals has expected inputSchema and required params."""
-    tool = next(t for t in tools if t.name == "get_speeding_intervals")
-    props = tool.inputSchema["properties"]
-    expected = {"assetIds", "startTime", "endTime", "queryBy", "includeAsset", "includeDriverId", "after", "severityLevels"}
-    assert expected.issubset(props.keys()), f"get_speeding_intervals missing properties"
-    assert set(tool.inputSchema.get("required", [])) == {"assetIds", "startTime"}
+EXPECTED_ORG_INFO_SCHEMA = {"type": "object", "properties": {}}
 
 
-async def test_get_safety_settings_schema_properties(tools):
-    """get_safety_settings has inputSchema with type object; no required params."""
-    tool = next(t for t in tools if t.name == "get_safety_settings")
-    assert tool.inputSchema.get("type") == "object"
-    assert "properties" in tool.inputSchema
-    assert tool.inputSchema["properties"] == {}
+def test_get_org_info_schema_properties(tools_by_name):
+    """get_org_info takes no arguments: its inputSchema is exactly an empty object."""
+    schema = tools_by_name["get_org_info"].inputSchema
+    assert {k: v for k, v in schema.items() if k != "required"} == EXPECTED_ORG_INFO_SCHEMA
+    assert not schema.get("required")
+
 
+# ---------------------------------------------------------------------------
+# Precompiled argument validators
+# ---------------------------------------------------------------------------
 
-async def test_get_org_info_schema_properties(tools):
-    """get_org_info has inputSchema with type object; no required params."""
-    tool = next(t for t in tools if t.name == "get_org_info")
-    assert tool.inputSchema.get("type") == "object"
-    assert "properties" in tool.inputSchema
-    assert tool.inputSchema["properties"] == {}
-    assert "required" not in tool.inputSchema or tool.inputSchema.get("required") == []
+def test_each_tool_has_compiled_validator(tool_names):
+    """Every registered tool has a validator compiled from its inputSchema."""
+    assert set(_VALIDATORS) == tool_names
+
+
+def test_validator_enforces_required_and_types():
+    """Validators reject missing required fields and wrong types."""
+    validator = _VALIDATORS["get_trips"]
+    assert validator.is_valid({"ids": "281474976712793"})
+    assert not validator.is_valid({})
+    assert not validator.is_valid({"ids": "281474976712793", "completionStatus": "done"})
+
+
+@pytest.mark.parametrize("name,arguments", [
+    ("get_vehicle", {"id": ""}),
+    ("get_trips", {"ids": ""}),
+    ("create_driver", {"name": "Jane", "username": "", "password": "pw"}),
+    ("get_safety_events_by_id", {"safetyEventIds": []}),
+    ("get_safety_events_by_id", {"safetyEventIds": ""}),
+    ("get_speeding_intervals", {"assetIds": ["1"], "startTime": ""}),
+])
+def test_validator_rejects_empty_required_values(name, arguments):
+    """Required arguments must be non-empty, not just present."""
+    assert not _VALIDATORS[name].is_valid(arguments)
+
+
+async def test_call_tool_reports_invalid_arguments(monkeypatch):
+    """Invalid arguments are reported as an error without creating the API client."""
+    get_client = MagicMock()
+    monkeypatch.setattr(server, "get_samsara_client", get_client)
+    result = await server.call_tool("get_vehicle", {"id": ""})
+    assert result.isError
+    assert result.content[0].text.startswith("Error: Invalid arguments for get_vehicle: ")
+    get_client.assert_not_called()
+
+
+@pytest.mark.parametrize("name,arguments,expected", [
+    ("get_trips", {"ids": ""},
+     "Error: Invalid arguments for get_trips: ids: '' should be non-empty. "
+     "Use list_vehicles to find asset IDs."),
+    ("get_trips", {},
+     "Error: Invalid arguments for get_trips: 'ids' is a required property. "
+     "Use list_vehicles to find asset IDs."),
+    ("get_safety_events_by_id", {"safetyEventIds": []},
+     "Error: Invalid arguments for get_safety_events_by_id: safetyEventIds: [] should be non-empty. "
+     "Use get_safety_events to discover event IDs."),
+    ("get_vehicle", {"id": ""},
+     "Error: Invalid arguments for get_vehicle: id: '' should be non-empty"),
+])
+async def test_invalid_arguments_name_the_field_and_hint(name, arguments, expected):
+    """Validation errors name the offending argument and add any per-tool hint."""
+    result = await server.call_tool(name, arguments)
+    assert result.content[0].text == expected
+
+
+def test_every_tool_has_handler(tool_names):
+    """Each registered tool has a call_tool handler, and no handler lacks a tool."""
+    assert set(TOOL_HANDLERS) == tool_names
+
+
+async def test_call_tool_unknown_tool_returns_error(caplog):
+    """Unknown tool names are rejected with error text, and logged, before reaching the API."""
+    result = await server.call_tool("no_such_tool", {})
+    assert result.isError
+    assert result.content[0].text == "Error: Unknown tool: no_such_tool"
+    assert "no_such_tool" in caplog.text
+
+
+def test_get_server_registers_handlers_once(monkeypatch):
+    """get_server() builds one MCP server with list_tools/call_tool registered."""
+    from mcp.types import CallToolRequest, ListToolsRequest
+
+    monkeypatch.setattr(server, "_server", None)
+    srv = server.get_server()
+    assert ListToolsRequest in srv.request_handlers
+    assert CallToolRequest in srv.request_handlers
+    assert server.get_server() is srv
 
 
 # ---------------------------------------------------------------------------
-# Descriptions present
+# Rate limiting
 # ---------------------------------------------------------------------------
 
-async def test_each_tool_has_description(tools):
-    """Every tool has a non-empty description."""
-    for tool in tools:
-        assert hasattr(tool, "description"), f"{tool.name} missing description"
-        assert tool.description and tool.description.strip(), (
-            f"{tool.name} has empty description"
-        )
+async def test_rate_limiter_allows_burst_then_spaces_calls(monkeypatch):
+    """A 5 req/sec limiter admits 5 calls at once, then delays the next by ~1/5 s."""
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(server.asyncio, "sleep", fake_sleep)
+    limiter = _RateLimiter(5)
+    for _ in range(5):
+        await limiter.acquire()
+    assert sleeps == []
+    await limiter.acquire()
+    assert len(sleeps) == 1
+    assert 0.15 < sleeps[0] <= 0.2
+
+
+async def test_rate_limiter_backs_off_after_429(monkeypatch):
+    """A 429 with Retry-After delays the next call on that tool by about that long."""
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(server.asyncio, "sleep", fake_sleep)
+    limiter = _RateLimiter(5)
+
+    async def rate_limited():
+        raise SamsaraRateLimitError("Too many requests", retry_after=3)
+
+    await server._invoke(rate_limited(), limiter)
+    await limiter.acquire()
+    assert len(sleeps) == 1
+    assert 2.9 < sleeps[0] <= 3.0
+
+
+def test_every_tool_is_rate_limited(tool_names):
+    """Each tool has a limiter; documented 5 req/sec endpoints use the tighter rate."""
+    assert set(server._RATE_LIMITERS) == tool_names
+    assert server._RATE_LIMITERS["get_speeding_intervals"]._interval == pytest.approx(1 / 5)
+    assert server._RATE_LIMITERS["list_vehicles"]._interval == pytest.approx(1 / 25)
+
+
+async def test_call_tool_rejects_when_overloaded(monkeypatch):
+    """Calls beyond the pending-call cap are rejected without reaching the API."""
+    client = MagicMock()
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    monkeypatch.setattr(server, "_pending_tools", server._MAX_PENDING_TOOLS)
+    result = await server.call_tool("list_tags", {})
+    assert result.isError
+    assert result.content[0].text == (
+        f"Error: Server overloaded ({server._MAX_PENDING_TOOLS} tool calls pending)."
+        "\n\nPlease wait 1 second before retrying."
+    )
+    assert not client.method_calls
+
+
+async def test_rate_limit_wait_does_not_hold_a_tool_slot(monkeypatch):
+    """Calls wait on their tool's rate limiter before taking a concurrency slot."""
+    slot_held = []
+
+    class RecordingLimiter(_RateLimiter):
+        async def acquire(self):
+            slot_held.append(server._TOOL_SEM.locked())
+
+    client = MagicMock()
+    client.list_drivers = AsyncMock(return_value={"data": []})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    monkeypatch.setattr(server, "_TOOL_SEM", asyncio.Semaphore(1))
+    monkeypatch.setitem(server._RATE_LIMITERS, "get_drivers", RecordingLimiter(25))
+    await server.call_tool("get_drivers", {})
+    assert slot_held == [False]
+
+
+async def test_rate_limit_error_text(monkeypatch):
+    """Samsara 429s are reported with the retry hint."""
+    client = MagicMock()
+    client.list_drivers = AsyncMock(
+        side_effect=SamsaraRateLimitError("Rate limit exceeded", retry_after=3)
+    )
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    result = await server.call_tool("get_drivers", {})
+    assert result[0].text == (
+        "Error: Rate limit exceeded\n\nPlease wait 3 seconds before retrying."
+    )
+
+
+def test_format_error_per_exception_type():
+    """Each Samsara exception type maps to its error text; others are 'Unexpected error'."""
+    assert server._format_error(SamsaraRateLimitError("Slow down")) == "Error: Slow down"
+    assert server._format_error(SamsaraRateLimitError("Slow down", retry_after=2)) == (
+        "Error: Slow down\n\nPlease wait 2 seconds before retrying."
+    )
+    assert server._format_error(SamsaraRateLimitError("Slow down", retry_after=1)) == (
+        "Error: Slow down\n\nPlease wait 1 second before retrying."
+    )
+    assert server._format_error(SamsaraAPIError("Not found", status_code=404)) == "Error: Not found"
+    assert server._format_error(SamsaraAPIError(
+        "Bad request", status_code=400,
+        response_body={"message": "bad"}, response_text='{"message":"bad"}',
+    )) == 'Error: Bad request\n\nResponse details: {"message":"bad"}'
+    assert server._format_error(SamsaraError("Network error")) == "Error: Network error"
+    assert server._format_error(KeyError("x")) == "Unexpected error: KeyError: 'x'"
+
+
+def test_format_error_truncates_long_response_details():
+    """Oversized error bodies are cut to _MAX_ERROR_DETAILS characters and marked."""
+    body = "x" * (server._MAX_ERROR_DETAILS + 100)
+    text = server._format_error(SamsaraAPIError(
+        "Server error", status_code=500, response_body={"message": body}, response_text=body,
+    ))
+    assert text == (
+        "Error: Server error\n\nResponse details: "
+        + "x" * server._MAX_ERROR_DETAILS + "... [truncated]"
+    )
+
+
+async def test_invoke_renders_result_and_errors():
+    """_invoke returns handler results as JSON text and errors as error text."""
+    async def ok():
+        return {"data": []}
+
+    async def api_error():
+        raise SamsaraAPIError("Bad request", status_code=400, response_body={"message": "bad"})
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    assert json.loads((await server._invoke(ok(), _RateLimiter(5)))[0].text) == {"data": []}
+    assert (await server._invoke(api_error(), _RateLimiter(5)))[0].text.startswith(
+        "Error: Bad request\n\nResponse details: "
+    )
+    assert (await server._invoke(boom(), _RateLimiter(5)))[0].text == "Unexpected error: RuntimeError: boom"
+
+
+async def test_invoke_reports_unencodable_result():
+    """A response orjson cannot encode comes back as error text instead of raising."""
+    async def huge_int():
+        return {"data": 2**64}
+
+    result = await server._invoke(huge_int(), _RateLimiter(5))
+    assert result[0].text == "Unexpected error: TypeError: Integer exceeds 64-bit range"
+
+
+def test_text_matches_validated_text_content():
+    """_text builds the same TextContent (and wire JSON) as the validating constructor."""
+    from mcp.types import TextContent
+
+    built = server._text("hello")
+    expected = TextContent(type="text", text="hello")
+    assert built == expected
+    assert built.model_dump_json(by_alias=True, exclude_none=True) == (
+        expected.model_dump_json(by_alias=True, exclude_none=True)
+    )
+
+
+def test_dumps_is_compact_json():
+    """_dumps emits compact JSON that round-trips to the same data."""
+    payload = {"data": [{"id": "1", "name": "Truck", "tags": [], "odometer": 12.5}], "pagination": {"hasNextPage": False}}
+    assert server._dumps(payload) == json.dumps(payload, separators=(",", ":"))
+
+
+def test_dumps_indents_when_pretty_json_enabled(monkeypatch):
+    """With SAMSARA_PRETTY_JSON the output matches json.dumps(indent=2)."""
+    import orjson
+
+    monkeypatch.setattr(server, "_DUMPS_OPTION", orjson.OPT_INDENT_2)
+    payload = {"data": [{"id": "1", "tags": []}], "pagination": {"hasNextPage": False}}
+    assert server._dumps(payload) == json.dumps(payload, indent=2)
+
+
+def test_default_window_formats_rfc3339():
+    """Default time windows are RFC 3339 UTC strings matching strftime output."""
+    from datetime import datetime, timezone
+
+    now = 1560453000
+    start, end = server._default_window(now, 300)
+    fmt = "%Y-%m-%dT%H:%M:%SZ"
+    assert end == datetime.fromtimestamp(now, timezone.utc).strftime(fmt)
+    assert start == datetime.fromtimestamp(now - 300, timezone.utc).strftime(fmt)
+
+
+async def test_create_driver_passes_only_set_optional_fields(monkeypatch):
+    """create_driver sends required fields plus only the optional fields provided."""
+    client = MagicMock()
+    client.create_driver = AsyncMock(return_value={"data": {"id": "1"}})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    await server.call_tool("create_driver", {
+        "name": "Jane", "username": "jane", "password": "pw",
+        "phone": "555-0100", "eldExempt": False,
+    })
+    client.create_driver.assert_awaited_once_with({
+        "name": "Jane", "username": "jane", "password": "pw",
+        "phone": "555-0100", "eldExempt": False,
+    })
+
+
+async def test_get_speeding_intervals_maps_arguments_to_client_keywords(monkeypatch):
+    """get_speeding_intervals passes each argument under its client keyword, None when unset."""
+    client = MagicMock()
+    client.get_speeding_intervals = AsyncMock(return_value={"data": []})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    await server.call_tool("get_speeding_intervals", {
+        "assetIds": ["281474"], "startTime": "2024-01-01T00:00:00Z", "includeAsset": True,
+    })
+    client.get_speeding_intervals.assert_awaited_once_with(
+        asset_ids=["281474"],
+        start_time="2024-01-01T00:00:00Z",
+        end_time=None,
+        query_by=None,
+        include_asset=True,
+        include_driver_id=None,
+        after=None,
+        severity_levels=None,
+    )
+
+
+async def test_get_speeding_intervals_auto_paginate_merges_pages(monkeypatch):
+    """autoPaginate follows endCursor until hasNextPage is false and merges the data."""
+    pages = {
+        None: {"data": [{"id": 1}], "pagination": {"endCursor": "c1", "hasNextPage": True}},
+        "c1": {"data": [{"id": 2}], "pagination": {"endCursor": "c2", "hasNextPage": False}},
+    }
+    client = MagicMock()
+    client.get_speeding_intervals = AsyncMock(side_effect=lambda **kw: pages[kw["after"]])
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    result = await server.call_tool("get_speeding_intervals", {
+        "assetIds": ["281474"], "startTime": "2024-01-01T00:00:00Z", "autoPaginate": True,
+    })
+    assert json.loads(result[0].text) == {
+        "data": [{"id": 1}, {"id": 2}],
+        "pagination": {"endCursor": "c2", "hasNextPage": False},
+    }
+    assert client.get_speeding_intervals.await_count == 2
+
+
+async def test_safety_event_ids_string_is_split_and_trimmed(monkeypatch):
+    """A comma-separated safetyEventIds string becomes a list of trimmed, non-empty IDs."""
+    client = MagicMock()
+    client.get_safety_events_by_id = AsyncMock(return_value={"data": []})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    await server.call_tool("get_safety_events_by_id", {"safetyEventIds": " a, b,,c "})
+    assert client.get_safety_events_by_id.call_args.kwargs["safety_event_ids"] == ["a", "b", "c"]
+    assert not _VALIDATORS["get_safety_events_by_id"].is_valid({"safetyEventIds": " , "})
+
+
+# ---------------------------------------------------------------------------
+# Response caching
+# ---------------------------------------------------------------------------
+
+async def test_list_tags_cached_until_create_tag(monkeypatch):
+    """Repeated list_tags calls hit the API once; create_tag invalidates the cache."""
+    client = MagicMock()
+    client.list_tags = AsyncMock(return_value={"data": []})
+    client.create_tag = AsyncMock(return_value={"data": {"id": "1"}})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    monkeypatch.setattr(server, "_response_cache", {})
+
+    await server.call_tool("list_tags", {"limit": 10})
+    await server.call_tool("list_tags", {"limit": 10})
+    assert client.list_tags.await_count == 1
+
+    await server.call_tool("create_tag", {"name": "New"})
+    await server.call_tool("list_tags", {"limit": 10})
+    assert client.list_tags.await_count == 2
+
+
+async def test_org_info_cached_with_its_own_ttl(monkeypatch):
+    """get_org_info is served from cache until its (longer) TTL lapses."""
+    client = MagicMock()
+    client.get_organization_info = AsyncMock(return_value={"data": {"id": "org"}})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    monkeypatch.setattr(server, "_response_cache", {})
+    clock = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock[0])
+
+    await server.call_tool("get_org_info", {})
+    clock[0] += server._CACHE_TTLS["get_org_info"] - 1
+    await server.call_tool("get_org_info", {})
+    assert client.get_organization_info.await_count == 1
+
+    clock[0] += 2
+    await server.call_tool("get_org_info", {})
+    assert client.get_organization_info.await_count == 2
+
+
+async def test_cache_ttl_starts_when_fetch_completes(monkeypatch):
+    """A slow fetch does not eat into the cached result's TTL."""
+    clock = [1000.0]
+
+    async def slow_org_info():
+        clock[0] += 10
+        return {"data": {"id": "org"}}
+
+    monkeypatch.setattr(server, "_response_cache", {})
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock[0])
+    await server._cached("get_org_info", {}, slow_org_info)
+    expires, _ = server._response_cache[server._cache_key("get_org_info", {})]
+    assert expires == 1010.0 + server._CACHE_TTLS["get_org_info"]
+
+
+async def test_cache_evicts_oldest_live_entries_when_full(monkeypatch):
+    """The cache never grows past _CACHE_MAX_ENTRIES, even when every entry is fresh."""
+    monkeypatch.setattr(server, "_response_cache", {})
+    monkeypatch.setattr(server, "_CACHE_MAX_ENTRIES", 2)
+
+    async def fetch():
+        return {"data": []}
+
+    for limit in (1, 2, 3):
+        await server._cached("list_tags", {"limit": limit}, fetch)
+    assert list(server._response_cache) == [
+        server._cache_key("list_tags", {"limit": 2}), server._cache_key("list_tags", {"limit": 3}),
+    ]
+
+
+@pytest.mark.parametrize("name,arguments", [
+    ("list_tags", {"foo": {"a": 1}}),
+    ("get_org_info", {"x": [{"a": 1}]}),
+])
+async def test_cached_tools_accept_nested_extra_arguments(monkeypatch, name, arguments):
+    """Undeclared nested arguments are still cacheable, as the old handlers ignored them."""
+    client = MagicMock()
+    client.list_tags = AsyncMock(return_value={"data": []})
+    client.get_organization_info = AsyncMock(return_value={"data": {"id": "org"}})
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    monkeypatch.setattr(server, "_response_cache", {})
+    first = await server.call_tool(name, arguments)
+    second = await server.call_tool(name, arguments)
+    assert first[0].text == second[0].text
+    assert len(client.method_calls) == 1
+
+
+async def test_invalidation_discards_in_flight_fetch(monkeypatch):
+    """A list_tags fetch that was in flight when create_tag ran is not cached."""
+    monkeypatch.setattr(server, "_response_cache", {})
+    release = asyncio.Event()
+
+    async def stale_tags():
+        await release.wait()
+        return {"data": ["stale"]}
+
+    pending = asyncio.ensure_future(server._cached("list_tags", {}, stale_tags))
+    await asyncio.sleep(0)
+    server._invalidate_cache("list_tags")
+    release.set()
+    assert await pending == {"data": ["stale"]}
+    assert server._response_cache == {}
+    assert server._inflight == {}
+
+
+async def test_concurrent_identical_calls_share_one_request(monkeypatch):
+    """Identical calls in flight at the same time are coalesced onto one API request."""
+    release = asyncio.Event()
+
+    async def slow_speeding(**kwargs):
+        await release.wait()
+        return {"data": []}
+
+    client = MagicMock()
+    client.get_speeding_intervals = AsyncMock(side_effect=slow_speeding)
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    # Fresh limiter so all three calls are admitted at once regardless of earlier tests
+    monkeypatch.setitem(server._RATE_LIMITERS, "get_speeding_intervals", _RateLimiter(5))
+    arguments = {"assetIds": ["281474"], "startTime": "2024-01-01T00:00:00Z"}
+
+    calls = asyncio.gather(*(server.call_tool("get_speeding_intervals", arguments) for _ in range(3)))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release.set()
+    results = await calls
+    assert client.get_speeding_intervals.await_count == 1
+    assert all(json.loads(r[0].text) == {"data": []} for r in results)
+    assert server._inflight == {}
+
+
+async def test_shared_results_skip_rate_limiter(monkeypatch):
+    """Cache hits and coalesced waiters do not take rate-limit tokens."""
+    acquired = []
+
+    class CountingLimiter(_RateLimiter):
+        async def acquire(self):
+            acquired.append(self)
+
+    release = asyncio.Event()
+
+    async def slow_speeding(**kwargs):
+        await release.wait()
+        return {"data": []}
+
+    client = MagicMock()
+    client.list_tags = AsyncMock(return_value={"data": []})
+    client.get_speeding_intervals = AsyncMock(side_effect=slow_speeding)
+    monkeypatch.setattr(server, "get_samsara_client", lambda: client)
+    monkeypatch.setattr(server, "_response_cache", {})
+    monkeypatch.setitem(server._RATE_LIMITERS, "list_tags", CountingLimiter(25))
+    monkeypatch.setitem(server._RATE_LIMITERS, "get_speeding_intervals", CountingLimiter(5))
+
+    await server.call_tool("list_tags", {})
+    await server.call_tool("list_tags", {})
+    assert len(acquired) == 1
+
+    arguments = {"assetIds": ["281474"], "startTime": "2024-01-01T00:00:00Z"}
+    calls = asyncio.gather(*(server.call_tool("get_speeding_intervals", arguments) for _ in range(3)))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release.set()
+    await calls
+    assert len(acquired) == 2
+
+
+# ---------------------------------------------------------------------------
+# Descriptions informative
+# ---------------------------------------------------------------------------
+
+# Each tool and the words, at least one of which its description must mention
+KEYWORDS = [
+    ("list_vehicles", ("vehicle",)),
+    ("get_vehicle", ("vehicle", "retrieve")),
+    ("update_vehicle", ("update", "vehicle")),
+    ("get_asset_locations", ("location", "gps")),
+    ("get_safety_events", ("safety", "event")),
+    ("get_safety_events_by_id", ("safety", "event", "id")),
+    ("get_trips", ("trip",)),
+    ("get_drivers", ("driver",)),
+    ("create_driver", ("create", "driver")),
+    ("get_driver", ("driver", "retrieve")),
+    ("update_driver", ("update", "driver")),
+    ("list_gateways", ("gateway", "list")),
+    ("list_tags", ("tag", "list")),
+    ("create_tag", ("tag", "create")),
+    ("get_speeding_intervals", ("speeding", "interval")),
+    ("get_safety_settings", ("safety", "settings")),
+    ("get_org_info", ("organization", "org")),
+]
 
 
-async def test_descriptions_are_informative(tools):
+@pytest.mark.parametrize("name, keywords", KEYWORDS, ids=[name for name, _ in KEYWORDS])
+def test_descriptions_are_informative(descriptions_lower, name, keywords):
     """Tool descriptions mention relevant concepts (vehicles, drivers, etc.)."""
-    by_name = {t.name: t for t in tools}
-    assert "vehicle" in by_name["list_vehicles"].description.lower()
-    assert "vehicle" in by_name["get_vehicle"].description.lower() or "retrieve" in by_name["get_vehicle"].description.lower()
-    assert "update" in by_name["update_vehicle"].description.lower() or "vehicle" in by_name["update_vehicle"].description.lower()
-    assert "location" in by_name["get_asset_locations"].description.lower() or "gps" in by_name["get_asset_locations"].description.lower()
-    assert "safety" in by_name["get_safety_events"].description.lower() or "event" in by_name["get_safety_events"].description.lower()
-    assert "safety" in by_name["get_safety_events_by_id"].description.lower() or "event" in by_name["get_safety_events_by_id"].description.lower() or "id" in by_name["get_safety_events_by_id"].description.lower()
-    assert "trip" in by_name["get_trips"].description.lower()
-    assert "driver" in by_name["get_drivers"].description.lower()
-    assert "create" in by_name["create_driver"].description.lower() or "driver" in by_name["create_driver"].description.lower()
-    assert "driver" in by_name["get_driver"].description.lower() or "retrieve" in by_name["get_driver"].description.lower()
-    assert "update" in by_name["update_driver"].description.lower() or "driver" in by_name["update_driver"].description.lower()
-    assert "gateway" in by_name["list_gateways"].description.lower() or "list" in by_name["list_gateways"].description.lower()
-    assert "tag" in by_name["list_tags"].description.lower() or "list" in by_name["list_tags"].description.lower()
-    assert "tag" in by_name["create_tag"].description.lower() or "create" in by_name["create_tag"].description.lower()
-    assert "speeding" in by_name["get_speeding_intervals"].description.lower() or "interval" in by_name["get_speeding_intervals"].description.lower()
-    assert "safety" in by_name["get_safety_settings"].description.lower() or "settings" in by_name["get_safety_settings"].description.lower()
-    assert "organization" in by_name["get_org_info"].description.lower() or "org" in by_name["get_org_info"].description.lower()
+    description = descriptions_lower[name]
+    assert any(keyword in description for keyword in keywords), (
+        f"{name} description mentions none of {keywords}"
+    )